@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import streamlit as st
+from styles import inject_theme
 
 st.set_page_config(
     page_title=" Aplicaciones Termodinámicas",
@@ -9,59 +10,9 @@ st.set_page_config(
     layout="wide"
 )
 
-custom_css = """
-
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-    }
-
-    .nota-info {
-        color: #98FB98;
-    }
-
-
-    /* Estilo para el texto de la nota */
-    .nota-info {
-        color: #98FB98; /* Color Verde Pálido para las letras */
-    }
-
-
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
+# --- Estilos CSS Personalizados ---
+inject_theme()
+
 st.title("Simulaciones Interactivas de Termodinámica: Un Laboratorio Virtual")
 
 st.markdown("""
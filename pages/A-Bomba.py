@@ -2,138 +2,122 @@
 # -*- coding: utf-8 -*-
 
 import streamlit as st
-from iapws import IAPWS97
-
-# --- Estilos CSS Personalizados ---
-custom_css = """
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-        height: 100px; /* Altura fija para alinear cajas */
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    .nota-info {
-        color: #98FB98;
-    }
-</style>
+from propiedades import liquido_saturado_vh, saturacion_valida
+from recursos import cargar_imagen
+from styles import fila_de_tarjetas, inject_theme
+
+# --- Factores de Conversión ---
+PSI_TO_KPA = 6.89476
+PSI_TO_MPA = PSI_TO_KPA / 1000
+MPA_TO_PSI = 145.038
+M3S_TO_FT3S = 35.3147
+KW_TO_HP = 1.34102
+KJ_KG_TO_BTU_LBM = 0.429923
+
+# --- Teoría (HTML estático con las ecuaciones ya escritas en MathML) ---
+_W_BOMBA = "<msub><mover><mi>W</mi><mo>˙</mo></mover><mtext>bomba</mtext></msub>"
+_M_DOT = "<mover><mi>m</mi><mo>˙</mo></mover>"
+_DELTA_P = "<mo>(</mo><msub><mi>P</mi><mn>2</mn></msub><mo>−</mo><msub><mi>P</mi><mn>1</mn></msub><mo>)</mo>"
+_DELTA_H = "<msub><mi>h</mi><mn>2</mn></msub><mo>−</mo><msub><mi>h</mi><mn>1</mn></msub>"
+
+THEORY_BOMBA_HTML = f"""
+<details class="teoria">
+<summary>📘 Fundamentos Termodinámicos de Bombas Centrífugas</summary>
+<p>Las <b>bombas</b> son dispositivos mecánicos diseñados para <b>incrementar la presión de un líquido</b>, transportándolo de una región de menor presión a otra de mayor presión. Son ampliamente usadas en sistemas de suministro de agua, plantas termoeléctricas, procesos industriales y sistemas de calefacción y refrigeración.</p>
+<p>A diferencia de toberas y difusores, <b>las bombas sí realizan trabajo mecánico</b> sobre el fluido. En términos de la <b>Primera Ley de la Termodinámica para sistemas abiertos (volumen de control)</b>, la potencia de bombeo se calcula como:</p>
+<math display="block">{_W_BOMBA}<mo>=</mo>{_M_DOT}<mo>(</mo>{_DELTA_H}<mo>)</mo></math>
+<p>donde:</p>
+<ul>
+<li><i>ṁ</i> es el flujo másico de líquido</li>
+<li><i>h</i><sub>1</sub> y <i>h</i><sub>2</sub> son las entalpías específica a la entrada y salida de la bomba, respectivamente</li>
+</ul>
+<p>En líquidos <b>incompresibles</b>, la variación de entalpía puede expresarse como una diferencia de presión:</p>
+<math display="block">{_DELTA_H}<mo>=</mo><mi>v</mi>{_DELTA_P}</math>
+<p>donde:</p>
+<ul>
+<li><i>v</i> es el <b>volumen específico</b>, prácticamente constante</li>
+<li><i>P</i><sub>1</sub> y <i>P</i><sub>2</sub> son las presiones a la entrada y salida</li>
+</ul>
+<p>De esta forma, la potencia requerida por la bomba es:</p>
+<math display="block">{_W_BOMBA}<mo>=</mo>{_M_DOT}<mi>v</mi>{_DELTA_P}</math>
+<p>En la práctica, se debe considerar la <b>eficiencia de la bomba</b>, que relaciona la potencia hidráulica útil con la potencia suministrada por el motor.</p>
+</details>
 """
-st.markdown(custom_css, unsafe_allow_html=True)
 
-# -----------------------------------------------------------------------------
-# CONFIGURACIÓN DE LA PÁGINA DE STREAMLIT
-# -----------------------------------------------------------------------------
-# Esta configuración debe ser el primer comando de Streamlit
-try:
-    st.set_page_config(
-        page_title="Cálculo de Bomba",
-        layout="centered",
-        initial_sidebar_state="expanded"
-    )
-except st.errors.StreamlitAPIException as e:
-    if "st.set_page_config() can only be called once per app" not in str(e):
-        raise e
+# --- Estilos CSS Personalizados ---
+inject_theme(".resultado-final { height: 100px; }")
 
 # -----------------------------------------------------------------------------
 # FUNCIÓN DE CÁLCULO MODIFICADA
 # -----------------------------------------------------------------------------
 
 
+# --- Unidades de cada sistema ---
+SI = 'Sistema Internacional (SI)'
+IMPERIAL = 'Sistema Inglés (Imperial)'
+UNITS = {
+    SI: {
+        "power": "kW",
+        "specific_work": "kJ/kg",
+        "enthalpy": "kJ/kg",
+        "volume_flow": "m³/s",
+        "pressure_in": "kPa",
+        "pressure_out": "MPa"
+    },
+    IMPERIAL: {
+        "power": "hp",
+        "specific_work": "Btu/lbm",
+        "enthalpy": "Btu/lbm",
+        "volume_flow": "ft³/s",
+        "pressure_in": "psi",
+        "pressure_out": "psi"
+    },
+}
+
+
+def entradas_a_si(caudal_volumetrico: float, presion_entrada: float,
+                  presion_salida: float, unit_system: str) -> tuple:
+    """
+    Convierte las entradas de la barra lateral a SI: caudal en m³/s y
+    presiones en MPa (la unidad que usa IAPWS-IF97).
+    """
+    if unit_system == SI:
+        # P₁ se da en kPa y P₂ en MPa
+        return caudal_volumetrico, presion_entrada / 1000, presion_salida
+    # Sistema Inglés: ambas presiones se dan en psi
+    return (caudal_volumetrico / M3S_TO_FT3S,
+            presion_entrada * PSI_TO_MPA,
+            presion_salida * PSI_TO_MPA)
+
+
+@st.cache_data(max_entries=256, ttl="1h")
 def calcular_bomba(
-    caudal_volumetrico: float,
-    presion_entrada: float,
-    presion_salida: float,
-    unit_system: str
+    caudal_volumetrico_m3_s: float,
+    presion_entrada_mpa: float,
+    presion_salida_mpa: float
 ) -> dict:
     """
     Calcula el trabajo, la potencia y la entalpía de salida para una bomba.
-    Maneja tanto el Sistema Internacional como el Sistema Inglés.
+    Recibe siempre entradas en SI y devuelve los resultados en ambos sistemas
+    de unidades, de modo que cambiar de sistema no repite el cálculo.
     """
-    # --- Factores de Conversión ---
-    PSI_TO_KPA = 6.89476
-    MPA_TO_PSI = 145.038
-    M3S_TO_FT3S = 35.3147
-    KW_TO_HP = 1.34102
-    KJ_KG_TO_BTU_LBM = 0.429923
-
-    # --- Unidades para los resultados ---
-    units = {}
-    if unit_system == 'Sistema Internacional (SI)':
-        units = {
-            "power": "kW",
-            "specific_work": "kJ/kg",
-            "enthalpy": "kJ/kg",
-            "volume_flow": "m³/s",
-            "pressure_in": "kPa",
-            "pressure_out": "MPa"
-        }
-        # Convertir entradas a SI (ya están en SI, solo se asignan)
-        caudal_volumetrico_m3_s = caudal_volumetrico
-        presion_entrada_kpa = presion_entrada
-        presion_salida_mpa = presion_salida
-    else:  # Sistema Inglés (Imperial)
-        units = {
-            "power": "hp",
-            "specific_work": "Btu/lbm",
-            "enthalpy": "Btu/lbm",
-            "volume_flow": "ft³/s",
-            "pressure_in": "psi",
-            "pressure_out": "psi"
-        }
-        # Convertir entradas de Inglés a SI para el cálculo
-        caudal_volumetrico_m3_s = caudal_volumetrico / M3S_TO_FT3S
-        presion_entrada_kpa = presion_entrada * PSI_TO_KPA
-        # La presión de salida en inglés también se da en psi, convertir a MPa
-        presion_salida_mpa = (presion_salida * PSI_TO_KPA) / 1000
-
-    # Conversión de Unidades para el cálculo interno (siempre en SI)
-    presion_entrada_mpa = presion_entrada_kpa / 1000
-    presion_salida_kpa = presion_salida_mpa * 1000
-
-    # PASO 1: Propiedades a la entrada (Líquido saturado) usando IAPWS97
+    # PASO 1: Propiedades a la entrada (Líquido saturado) usando IAPWS-IF97
+    if not saturacion_valida(presion_entrada_mpa):
+        return {"error": "La presión de entrada está fuera del rango de saturación de IAPWS-IF97."}
     try:
-        # IAPWS97 requiere Presión en MPa y Calidad (x=0 para líquido saturado)
-        estado_entrada = IAPWS97(P=presion_entrada_mpa, x=0)
-        v_especifico = estado_entrada.v  # m³/kg
-        h1_entalpia = estado_entrada.h    # kJ/kg
+        v_especifico, h1_entalpia = liquido_saturado_vh(presion_entrada_mpa)  # m³/kg, kJ/kg
+        # Estados inválidos: seuif97 devuelve un código negativo
+        if v_especifico <= 0:
+            raise ValueError(f"estado fuera de rango (código {v_especifico})")
     except Exception as e:
-        st.error(f"Error al obtener propiedades del agua: {e}")
-        st.stop()
+        return {"error": f"Error al obtener propiedades del agua: {e}"}
 
     # PASO 2: Flujo másico (siempre en kg/s)
     flujo_masico_kgs = caudal_volumetrico_m3_s / v_especifico
 
-    # PASO 3: Trabajo específico (siempre en kJ/kg)
-    delta_presion_kpa = presion_salida_kpa - presion_entrada_kpa
-    trabajo_especifico_kj_kg = v_especifico * delta_presion_kpa
+    # PASO 3: Trabajo específico (siempre en kJ/kg; m³/kg · MPa · 1000 = kJ/kg)
+    delta_presion_mpa = presion_salida_mpa - presion_entrada_mpa
+    trabajo_especifico_kj_kg = v_especifico * delta_presion_mpa * 1000
 
     # PASO 4: Potencia de la bomba (siempre en kW)
     potencia_kw = flujo_masico_kgs * trabajo_especifico_kj_kg
@@ -141,38 +125,27 @@ def calcular_bomba(
     # PASO 5: Entalpía de salida (siempre en kJ/kg)
     h2_entalpia_kj_kg = h1_entalpia + trabajo_especifico_kj_kg
 
-    # --- Empaquetar resultados y convertir si es necesario ---
-    if unit_system == 'Sistema Inglés (Imperial)':
-        potencia_final = potencia_kw * KW_TO_HP
-        trabajo_especifico_final = trabajo_especifico_kj_kg * KJ_KG_TO_BTU_LBM
-        h2_entalpia_final = h2_entalpia_kj_kg * KJ_KG_TO_BTU_LBM
-        h1_entalpia_final = h1_entalpia * KJ_KG_TO_BTU_LBM
-    else:
-        potencia_final = potencia_kw
-        trabajo_especifico_final = trabajo_especifico_kj_kg
-        h2_entalpia_final = h2_entalpia_kj_kg
-        h1_entalpia_final = h1_entalpia
-
+    # --- Empaquetar resultados en ambos sistemas de unidades ---
     return {
-        "entradas": {
-            f"Caudal Volumétrico [{units['volume_flow']}]": caudal_volumetrico,
-            f"Presión de Entrada [{units['pressure_in']}]": presion_entrada,
-            f"Presión de Salida [{units['pressure_out']}]": presion_salida
-        },
         "propiedades_entrada": {
             "volumen_especifico_m3_kg": v_especifico,
-            "entalpia_h1_kj_kg": h1_entalpia_final,
-            "entalpia_h1_units": units['enthalpy']
         },
         "calculos_intermedios": {
             "flujo_masico_kgs": flujo_masico_kgs,
         },
-        "resultados_finales": {
-            "trabajo_especifico": trabajo_especifico_final,
-            "potencia_requerida": potencia_final,
-            "entalpia_h2": h2_entalpia_final
+        SI: {
+            "entalpia_h1": h1_entalpia,
+            "trabajo_especifico": trabajo_especifico_kj_kg,
+            "potencia_requerida": potencia_kw,
+            "entalpia_h2": h2_entalpia_kj_kg
+        },
+        IMPERIAL: {
+            "entalpia_h1": h1_entalpia * KJ_KG_TO_BTU_LBM,
+            "trabajo_especifico": trabajo_especifico_kj_kg * KJ_KG_TO_BTU_LBM,
+            "potencia_requerida": potencia_kw * KW_TO_HP,
+            "entalpia_h2": h2_entalpia_kj_kg * KJ_KG_TO_BTU_LBM
         },
-        "units": units
+        "error": None
     }
 
 
@@ -185,7 +158,7 @@ def calcular_bomba(
 # =========================
 col_img, col_title = st.columns([0.2, 1])
 with col_img:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Bomba.png", width=200)
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Bomba.png"), width=200)
 with col_title:
     st.title("Bomba: Análisis interactivo de Bomba")
 st.markdown("#### Esta herramienta calcula la potencia y entalpía para una bomba que maneja agua como líquido incompresible.")
@@ -195,38 +168,7 @@ st.write("---")
 # =========================
 # 📘 Teoría
 # =========================
-with st.expander("📘 Fundamentos Termodinámicos de Bombas Centrífugas"):
-    st.markdown(r"""
-Las **bombas** son dispositivos mecánicos diseñados para **incrementar la presión de un líquido**, transportándolo de una región de menor presión a otra de mayor presión. Son ampliamente usadas en sistemas de suministro de agua, plantas termoeléctricas, procesos industriales y sistemas de calefacción y refrigeración.
-
-A diferencia de toberas y difusores, **las bombas sí realizan trabajo mecánico** sobre el fluido. En términos de la **Primera Ley de la Termodinámica para sistemas abiertos (volumen de control)**, la potencia de bombeo se calcula como:
-
-$$
-\dot{W}_{bomba} = \dot{m} (h_2 - h_1)
-$$
-
-donde:
-- $\dot{m}$ es el flujo másico de líquido
-- $h_1$ y $h_2$ son las entalpías específica a la entrada y salida de la bomba, respectivamente
-
-En líquidos **incompresibles**, la variación de entalpía puede expresarse como una diferencia de presión:
-
-$$
-h_2 - h_1 = v (P_2 - P_1)
-$$
-
-donde:
-- $v$ es el **volumen específico**, prácticamente constante
-- $P_1$ y $P_2$ son las presiones a la entrada y salida
-
-De esta forma, la potencia requerida por la bomba es:
-
-$$
-\dot{W}_{bomba} = \dot{m} v (P_2 - P_1)
-$$
-
-En la práctica, se debe considerar la **eficiencia de la bomba**, que relaciona la potencia hidráulica útil con la potencia suministrada por el motor.
-""")
+st.html(THEORY_BOMBA_HTML)
 
 
 # =========================
@@ -253,7 +195,7 @@ Calcular:
 """)
 
 with col2:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/partes-de-una-bomba-centrifuga.jpg",
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/partes-de-una-bomba-centrifuga.jpg"),
              caption="**Partes de una bomba centrífuga .\\n\\nFuente: Seguas – Diagrama de bomba centrífuga (segua​s.com).")
     st.markdown("### Desarrollo visual")
     st.video("https://youtu.be/yqasAH1LFOw?si=_TbbgdZrU_uff-JP")
@@ -266,11 +208,11 @@ st.sidebar.header("Parámetros de Entrada")
 # Selector de Sistema de Unidades
 unit_system = st.sidebar.radio(
     "Seleccione el Sistema de Unidades",
-    ('Sistema Internacional (SI)', 'Sistema Inglés (Imperial)')
+    (SI, IMPERIAL)
 )
 
 # Entradas dinámicas basadas en el sistema de unidades
-if unit_system == 'Sistema Internacional (SI)':
+if unit_system == SI:
     v_dot = st.sidebar.slider(
         'Caudal Volumétrico (V̇) [m³/s]', min_value=0.001, max_value=0.1, value=0.0156, step=0.0001, format="%.4f")
     p1 = st.sidebar.slider(
@@ -286,68 +228,63 @@ else:  # Sistema Inglés (Imperial)
         'Presión de Salida (P₂) [psi]', min_value=50.0, max_value=2200.0, value=362.6, step=1.0, format="%.1f")
 
 
-# --- Realizar el cálculo con los valores de la UI ---
-calculo = calcular_bomba(
-    caudal_volumetrico=v_dot,
-    presion_entrada=p1,
-    presion_salida=p2,
-    unit_system=unit_system
-)
-
-# --- Extracción de resultados para mostrarlos ---
-entradas = calculo["entradas"]
-props = calculo["propiedades_entrada"]
-finales = calculo["resultados_finales"]
-units = calculo["units"]
-
 # -----------------------------------------------------------------------------
-# PRESENTACIÓN DE RESULTADOS EN EL ÁREA PRINCIPAL
+# PANEL DE RESULTADOS
 # -----------------------------------------------------------------------------
 
-st.header("Resultados del Cálculo")
-st.markdown("---")
 
-# --- Resumen Final en la parte superior ---
-st.subheader("Resumen Final")
-col1, col2, col3 = st.columns(3)
+def _results_panel(v_dot: float, p1: float, p2: float, unit_system: str) -> None:
+    """
+    Calcula y muestra los resultados de la bomba.
+    """
+    # --- Realizar el cálculo con los valores de la UI ---
+    # Se redondea al paso de los deslizadores para que valores casi idénticos
+    # compartan la misma entrada de caché
+    v_dot, p1, p2 = round(v_dot, 4), round(p1, 1), round(p2, 2)
+    calculo = calcular_bomba(*entradas_a_si(v_dot, p1, p2, unit_system))
+
+    if calculo.get("error"):
+        st.error(calculo["error"])
+        return
+
+    # --- Extracción de resultados para mostrarlos ---
+    units = UNITS[unit_system]
+    entradas = {
+        f"Caudal Volumétrico [{units['volume_flow']}]": v_dot,
+        f"Presión de Entrada [{units['pressure_in']}]": p1,
+        f"Presión de Salida [{units['pressure_out']}]": p2
+    }
+    props = calculo["propiedades_entrada"]
+    finales = calculo[unit_system]
 
-with col1:
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Potencia Requerida:</strong><br>
-        {finales['potencia_requerida']:.2f} {units['power']}
-    </div>
-    """, unsafe_allow_html=True)
+    # --- Presentación de resultados en el área principal ---
+    st.header("Resultados del Cálculo")
+    st.markdown("---")
 
-with col2:
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Trabajo Específico:</strong><br>
-        {finales['trabajo_especifico']:.4f} {units['specific_work']}
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Entalpía de Salida (h₂):</strong><br>
-        {finales['entalpia_h2']:.2f} {units['enthalpy']}
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown("<br>", unsafe_allow_html=True)
-
-# --- Pestañas con el detalle del cálculo ---
-with st.expander("Ver Detalles del Proceso de Cálculo"):
-    st.subheader("Condiciones y Propiedades")
-    st.markdown("**Datos de Entrada Seleccionados:**")
-    st.json(entradas)
-
-    st.markdown(f"**Propiedades del Agua a la Entrada (Líquido Saturado):**")
-    st.json({
-        f"Entalpía h₁ [{props['entalpia_h1_units']}]": f"{props['entalpia_h1_kj_kg']:.2f}",
-        "Volumen Específico v [m³/kg]": f"{props['volumen_especifico_m3_kg']:.6f} (usado para cálculos internos en SI)"
-    })
+    # --- Resumen Final en la parte superior ---
+    st.subheader("Resumen Final")
+    st.html(fila_de_tarjetas([
+        ("Potencia Requerida:", f"{finales['potencia_requerida']:.2f} {units['power']}"),
+        ("Trabajo Específico:", f"{finales['trabajo_especifico']:.4f} {units['specific_work']}"),
+        ("Entalpía de Salida (h₂):", f"{finales['entalpia_h2']:.2f} {units['enthalpy']}"),
+    ]))
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # --- Pestañas con el detalle del cálculo ---
+    with st.expander("Ver Detalles del Proceso de Cálculo"):
+        st.subheader("Condiciones y Propiedades")
+        st.markdown("**Datos de Entrada Seleccionados:**")
+        st.json(entradas)
+
+        st.markdown(f"**Propiedades del Agua a la Entrada (Líquido Saturado):**")
+        st.json({
+            f"Entalpía h₁ [{units['enthalpy']}]": f"{finales['entalpia_h1']:.2f}",
+            "Volumen Específico v [m³/kg]": f"{props['volumen_especifico_m3_kg']:.6f} (usado para cálculos internos en SI)"
+        })
+
+
+_results_panel(v_dot, p1, p2, unit_system)
 
 
 st.markdown("""
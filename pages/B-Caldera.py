@@ -1,162 +1,177 @@
 from typing import Dict, Any
 import math
-from iapws import IAPWS97
 import streamlit as st
+from propiedades import pt_valido, v_pt
+from recursos import cargar_imagen
+from styles import fila_de_tarjetas, inject_theme
+
+# --- Factores de Conversión ---
+PSI_TO_MPA = 0.00689476
+MM_TO_M = 0.001
+IN_TO_M = 0.0254
+MS_TO_FTS = 3.28084
+M2_TO_FT2 = 10.7639
+KGS_TO_LBMS = 2.20462
+M3S_TO_FT3S = 35.3147
+M3KG_TO_FT3LBM = 16.0185
+
+# Área de un círculo: A = (π/4)·D²
+_QUARTER_PI = math.pi * 0.25
 
 # -*- coding: utf-8 -*-
 
-# --- Estilos CSS Personalizados ---
-custom_css = """
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-        height: 110px; /* Altura fija para alinear cajas */
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    .nota-info {
-        color: #98FB98;
-    }
-</style>
+# --- Teoría (HTML estático con las ecuaciones ya escritas en MathML) ---
+_Q_DOT = "<mover><mi>Q</mi><mo>˙</mo></mover>"
+_W_S = "<msub><mover><mi>W</mi><mo>˙</mo></mover><mi>s</mi></msub>"
+_M_DOT = "<mover><mi>m</mi><mo>˙</mo></mover>"
+_SALTO_H = ("<mo>(</mo><msub><mi>h</mi><mtext>vapor</mtext></msub><mo>−</mo>"
+            "<msub><mi>h</mi><mtext>agua</mtext></msub><mo>)</mo>")
+
+THEORY_CALDERA_HTML = f"""
+<details class="teoria">
+<summary>Fundamentos Termodinámicos de Calderas (1ª Ley – Sistemas Abiertos)</summary>
+<p>Las <b>calderas</b> son dispositivos termodinámicos diseñados para <b>transferir calor a un fluido</b>, generalmente agua, con el fin de <b>generar vapor</b> que se utilizará en procesos industriales o generación de energía.</p>
+<p>Desde el punto de vista termodinámico, una caldera es un <b>sistema abierto en régimen estacionario</b>, ya que existe flujo de masa (agua/vapor) a través del volumen de control.</p>
+<hr>
+<h3>Aplicación de la Primera Ley de la Termodinámica</h3>
+<p>Para un sistema abierto en estado estacionario, la <b>Primera Ley</b> se expresa como:</p>
+<math display="block">{_Q_DOT}<mo>−</mo>{_W_S}<mo>=</mo>{_M_DOT}<mrow><mo>(</mo>
+<msub><mi>h</mi><mtext>salida</mtext></msub><mo>−</mo><msub><mi>h</mi><mtext>entrada</mtext></msub><mo>+</mo>
+<mfrac><mrow><msubsup><mi>V</mi><mn>2</mn><mn>2</mn></msubsup><mo>−</mo><msubsup><mi>V</mi><mn>1</mn><mn>2</mn></msubsup></mrow><mn>2</mn></mfrac>
+<mo>+</mo><mi>g</mi><mo>(</mo><msub><mi>z</mi><mn>2</mn></msub><mo>−</mo><msub><mi>z</mi><mn>1</mn></msub><mo>)</mo>
+<mo>)</mo></mrow></math>
+<p>Donde:</p>
+<ul>
+<li><i>Q̇</i>: Calor transferido al fluido [kW]</li>
+<li><i>Ẇ</i><sub>s</sub>: Trabajo de eje (en calderas típicamente <i>Ẇ</i><sub>s</sub> = 0)</li>
+<li><i>ṁ</i>: Flujo másico del fluido [kg/s]</li>
+<li><i>h</i>: Entalpía específica [kJ/kg]</li>
+<li><i>V</i>: Velocidad [m/s]</li>
+<li><i>z</i>: Altura [m]</li>
+<li><i>g</i>: Gravedad [9.81 m/s²]</li>
+</ul>
+<hr>
+<h3>Simplificación para Calderas</h3>
+<p>En las calderas comunes:</p>
+<ul>
+<li>No hay trabajo de eje: <i>Ẇ</i><sub>s</sub> = 0</li>
+<li>Cambios de energía cinética y potencial son despreciables:
+(<i>V</i><sub>2</sub><sup>2</sup> − <i>V</i><sub>1</sub><sup>2</sup>)/2 ≈ 0, <i>g</i>(<i>z</i><sub>2</sub> − <i>z</i><sub>1</sub>) ≈ 0</li>
+</ul>
+<p>Entonces, la ecuación se reduce a:</p>
+<math display="block">{_Q_DOT}<mo>=</mo>{_M_DOT}{_SALTO_H}</math>
+<p>Esto implica que la <b>tasa de transferencia de calor</b> está directamente relacionada con el <b>salto entálpico</b> entre el estado inicial (agua líquida) y el estado final (vapor).</p>
+<hr>
+<h3>Eficiencia térmica de la caldera</h3>
+<p>Aunque las calderas no producen trabajo mecánico directo, se puede definir una eficiencia basada en el uso del combustible:</p>
+<math display="block"><mi>η</mi><mo>=</mo><mfrac><mrow>{_M_DOT}{_SALTO_H}</mrow>
+<mrow><msub><mover><mi>m</mi><mo>˙</mo></mover><mtext>comb</mtext></msub><mo>·</mo><mtext>PCI</mtext></mrow></mfrac></math>
+<p>Donde:</p>
+<ul>
+<li><i>ṁ</i><sub>comb</sub>: Flujo másico del combustible</li>
+<li>PCI: Poder calorífico inferior del combustible</li>
+</ul>
+<hr>
+<h3>Conclusión</h3>
+<p>Las calderas son un claro ejemplo de aplicación de la <b>Primera Ley de la Termodinámica</b> en sistemas abiertos. Su análisis permite determinar el <b>calor requerido</b> para generar vapor a partir de agua líquida, esencial para el diseño y evaluación energética de ciclos térmicos como el de Rankine.</p>
+<p>📚 <b>Fuente</b>: Adaptado de <a href="https://termodinamica-1aa131.blogspot.com/2013/06/caldera.html" target="_blank">termodinamica-1aa131.blogspot.com</a></p>
+</details>
 """
-st.markdown(custom_css, unsafe_allow_html=True)
-
-# --- Configuración de la Página ---
-try:
-    st.set_page_config(
-        page_title="Análisis de Caldera",
-        layout="centered",
-        initial_sidebar_state="expanded"
-    )
-except st.errors.StreamlitAPIException as e:
-    if "st.set_page_config() can only be called once per app" not in str(e):
-        raise e
+
+# --- Estilos CSS Personalizados ---
+inject_theme(".resultado-final { height: 110px; }")
 
 # --- MODELO (Lógica de cálculo) ---
 
 
-@st.cache_data
+# --- Unidades de cada sistema ---
+SI = 'Sistema Internacional (SI)'
+IMPERIAL = 'Sistema Inglés (Imperial)'
+UNITS = {
+    SI: {
+        "pressure": "MPa", "temperature": "°C", "velocity": "m/s",
+        "diameter": "mm", "area": "m²", "mass_flow": "kg/s",
+        "volume_flow": "m³/s", "spec_vol": "m³/kg"
+    },
+    IMPERIAL: {
+        "pressure": "psi", "temperature": "°F", "velocity": "ft/s",
+        "diameter": "in", "area": "ft²", "mass_flow": "lbm/s",
+        "volume_flow": "ft³/s", "spec_vol": "ft³/lbm"
+    },
+}
+
+
+def entradas_a_si(P_proceso, T_in, T_out, V_out, D_val, unit_system: str) -> tuple:
+    """
+    Convierte las entradas de la barra lateral a SI: MPa, °C, m/s y m.
+    """
+    if unit_system == SI:
+        return P_proceso, T_in, T_out, V_out, D_val * MM_TO_M
+    return (P_proceso * PSI_TO_MPA, (T_in - 32) * 5/9, (T_out - 32) * 5/9,
+            V_out / MS_TO_FTS, D_val * IN_TO_M)
+
+
+@st.cache_data(max_entries=256)
 def calcular_propiedades_caldera(
-    P_proceso: float,
-    T_in: float,
-    T_out: float,
-    V_out: float,
-    D_val: float,
-    unit_system: str
+    P_MPa: float,
+    T_in_C: float,
+    T_out_C: float,
+    V_out_ms: float,
+    D_m: float
 ) -> Dict[str, Any]:
     """
-    Calcula las propiedades termodinámicas en una caldera, manejando unidades SI e Inglesas.
+    Calcula las propiedades termodinámicas en una caldera a partir de entradas
+    en SI y devuelve los resultados en ambos sistemas de unidades, de modo que
+    cambiar de sistema no repite el cálculo.
     """
-    # --- Factores de Conversión ---
-    PSI_TO_MPA = 0.00689476
-    MM_TO_M = 0.001
-    IN_TO_M = 0.0254
-    MS_TO_FTS = 3.28084
-    M2_TO_FT2 = 10.7639
-    KGS_TO_LBMS = 2.20462
-    M3S_TO_FT3S = 35.3147
-    M3KG_TO_FT3LBM = 16.0185
-
-    # --- Definición de Unidades para UI ---
-    units = {}
-    if unit_system == 'Sistema Internacional (SI)':
-        units = {
-            "pressure": "MPa", "temperature": "°C", "velocity": "m/s",
-            "diameter": "mm", "area": "m²", "mass_flow": "kg/s",
-            "volume_flow": "m³/s", "spec_vol": "m³/kg"
-        }
-        # Conversión de entradas a SI (base para cálculos)
-        P_in_MPa = P_out_MPa = P_proceso
-        T_in_C = T_in
-        T_out_C = T_out
-        V_out_ms = V_out
-        D_m = D_val * MM_TO_M
-    else:  # Sistema Inglés (Imperial)
-        units = {
-            "pressure": "psi", "temperature": "°F", "velocity": "ft/s",
-            "diameter": "in", "area": "ft²", "mass_flow": "lbm/s",
-            "volume_flow": "ft³/s", "spec_vol": "ft³/lbm"
-        }
-        # Conversión de entradas a SI (base para cálculos)
-        P_in_MPa = P_out_MPa = P_proceso * PSI_TO_MPA
-        T_in_C = (T_in - 32) * 5/9
-        T_out_C = (T_out - 32) * 5/9
-        V_out_ms = V_out / MS_TO_FTS
-        D_m = D_val * IN_TO_M
+    P_in_MPa = P_out_MPa = P_MPa  # Se asume presión constante
+
+    if not (pt_valido(P_out_MPa, T_out_C) and pt_valido(P_in_MPa, T_in_C)):
+        return {"error": "El estado de entrada o de salida está fuera del rango de validez de IAPWS-IF97."}
 
     try:
         # --- Cálculos Internos (siempre en SI) ---
-        A_m2 = (math.pi * D_m**2) / 4
-        T_in_K = T_in_C + 273.15
-        T_out_K = T_out_C + 273.15
-
         # Estado de salida para obtener volumen específico
-        estado_salida = IAPWS97(P=P_out_MPa, T=T_out_K)
-        v_out_m3kg = estado_salida.v
+        v_out_m3kg = v_pt(P_out_MPa, T_out_C)
+        if v_out_m3kg <= 0:
+            raise ValueError(f"estado de salida fuera de rango (código {v_out_m3kg})")
+
+        # Estado de entrada (misma presión; si la temperatura también coincide,
+        # es el mismo estado de salida y no hace falta evaluarlo de nuevo)
+        if abs(T_in_C - T_out_C) < 1e-6:
+            v_in_m3kg = v_out_m3kg
+        else:
+            v_in_m3kg = v_pt(P_in_MPa, T_in_C)
+            if v_in_m3kg <= 0:
+                raise ValueError(f"estado de entrada fuera de rango (código {v_in_m3kg})")
+
+        A_m2 = _QUARTER_PI * D_m * D_m
 
         # Flujo másico
         m_dot_kgs = (A_m2 * V_out_ms) / v_out_m3kg
 
-        # Estado de entrada
-        estado_entrada = IAPWS97(P=P_in_MPa, T=T_in_K)
-        v_in_m3kg = estado_entrada.v
-
         # Flujo volumétrico y velocidad de entrada
         V_dot_in_m3s = m_dot_kgs * v_in_m3kg
         V_in_ms = V_dot_in_m3s / A_m2
 
-        # --- Conversión de Resultados a Unidades Seleccionadas ---
-        if unit_system == 'Sistema Inglés (Imperial)':
-            area_final = A_m2 * M2_TO_FT2
-            v_in_final = v_in_m3kg * M3KG_TO_FT3LBM
-            v_out_final = v_out_m3kg * M3KG_TO_FT3LBM
-            m_dot_final = m_dot_kgs * KGS_TO_LBMS
-            V_dot_in_final = V_dot_in_m3s * M3S_TO_FT3S
-            V_in_final = V_in_ms * MS_TO_FTS
-        else:
-            area_final = A_m2
-            v_in_final = v_in_m3kg
-            v_out_final = v_out_m3kg
-            m_dot_final = m_dot_kgs
-            V_dot_in_final = V_dot_in_m3s
-            V_in_final = V_in_ms
-
+        # --- Resultados en ambos sistemas de unidades ---
         return {
-            "area": area_final,
-            "v_especifico_entrada": v_in_final,
-            "v_especifico_salida": v_out_final,
-            "flujo_masico": m_dot_final,
-            "flujo_volumetrico_entrada": V_dot_in_final,
-            "velocidad_entrada": V_in_final,
-            "units": units,
+            SI: {
+                "area": A_m2,
+                "v_especifico_entrada": v_in_m3kg,
+                "v_especifico_salida": v_out_m3kg,
+                "flujo_masico": m_dot_kgs,
+                "flujo_volumetrico_entrada": V_dot_in_m3s,
+                "velocidad_entrada": V_in_ms,
+            },
+            IMPERIAL: {
+                "area": A_m2 * M2_TO_FT2,
+                "v_especifico_entrada": v_in_m3kg * M3KG_TO_FT3LBM,
+                "v_especifico_salida": v_out_m3kg * M3KG_TO_FT3LBM,
+                "flujo_masico": m_dot_kgs * KGS_TO_LBMS,
+                "flujo_volumetrico_entrada": V_dot_in_m3s * M3S_TO_FT3S,
+                "velocidad_entrada": V_in_ms * MS_TO_FTS,
+            },
             "error": None
         }
     except Exception as e:
@@ -168,7 +183,7 @@ def calcular_propiedades_caldera(
 # =========================
 col_img, col_title = st.columns([0.2, 1])
 with col_img:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/%C3%8Dcono%20de%20calderas%20minimalista%20y%20funcional.png", width=200)
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/%C3%8Dcono%20de%20calderas%20minimalista%20y%20funcional.png"), width=200)
 with col_title:
     st.title("Caldera: Análisis Interactivo del Comportamiento Térmico")
 st.markdown("#### Explora cómo varían la temperatura, la presión y la entalpía del fluido en una caldera de vapor.")
@@ -178,70 +193,7 @@ st.write("---")
 # =========================
 # 📘 Teoría
 # =========================
-with st.expander("Fundamentos Termodinámicos de Calderas (1ª Ley – Sistemas Abiertos)"):
-    st.markdown(r"""
-Las **calderas** son dispositivos termodinámicos diseñados para **transferir calor a un fluido**, generalmente agua, con el fin de **generar vapor** que se utilizará en procesos industriales o generación de energía.
-
-Desde el punto de vista termodinámico, una caldera es un **sistema abierto en régimen estacionario**, ya que existe flujo de masa (agua/vapor) a través del volumen de control.
-
----
-
-### Aplicación de la Primera Ley de la Termodinámica
-
-Para un sistema abierto en estado estacionario, la **Primera Ley** se expresa como:
-
-$$
-\dot{Q} - \dot{W}_s = \dot{m} \left( h_{\text{salida}} - h_{\text{entrada}} + \frac{V_2^2 - V_1^2}{2} + g(z_2 - z_1) \right)
-$$
-
-Donde:
-- $\dot{Q}$: Calor transferido al fluido [kW]
-- $\dot{W}_s$: Trabajo de eje (en calderas típicamente $\dot{W}_s = 0$)
-- $\dot{m}$: Flujo másico del fluido [kg/s]
-- $h$: Entalpía específica [kJ/kg]
-- $V$: Velocidad [m/s]
-- $z$: Altura [m]
-- $g$: Gravedad [9.81 m/s²]
-
----
-
-### Simplificación para Calderas
-
-En las calderas comunes:
-- No hay trabajo de eje: $\dot{W}_s = 0$
-- Cambios de energía cinética y potencial son despreciables:
-  $\frac{V_2^2 - V_1^2}{2} \approx 0$, $g(z_2 - z_1) \approx 0$
-
-Entonces, la ecuación se reduce a:
-
-$$
-\dot{Q} = \dot{m} (h_{\text{vapor}} - h_{\text{agua}})
-$$
-
-Esto implica que la **tasa de transferencia de calor** está directamente relacionada con el **salto entálpico** entre el estado inicial (agua líquida) y el estado final (vapor).
-
----
-
-### Eficiencia térmica de la caldera
-
-Aunque las calderas no producen trabajo mecánico directo, se puede definir una eficiencia basada en el uso del combustible:
-
-$$
-\eta = \frac{\dot{m} (h_{\text{vapor}} - h_{\text{agua}})}{\dot{m}_{\text{comb}} \cdot \text{PCI}}
-$$
-
-Donde:
-- $\dot{m}_{\text{comb}}$: Flujo másico del combustible
-- $\text{PCI}$: Poder calorífico inferior del combustible
-
----
-
-### Conclusión
-
-Las calderas son un claro ejemplo de aplicación de la **Primera Ley de la Termodinámica** en sistemas abiertos. Su análisis permite determinar el **calor requerido** para generar vapor a partir de agua líquida, esencial para el diseño y evaluación energética de ciclos térmicos como el de Rankine.
-
-📚 **Fuente**: Adaptado de [termodinamica-1aa131.blogspot.com](https://termodinamica-1aa131.blogspot.com/2013/06/caldera.html)
-""")
+st.html(THEORY_CALDERA_HTML)
 
 # =========================
 # 🧪 Ejercicio y Figura
@@ -265,7 +217,7 @@ Determinar:
 **Fuente:** *Ejercicio tomado y adaptado de **LaMejorAsesoríaEducativa – YouTube***.
 """)
 with col2:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Caldera.png",
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Caldera.png"),
              caption="**Comparación esquemática del funcionamiento interno de una caldera tipo locomotora.\\n\\nFuente: Adaptado de https://termodinamica-1aa131.blogspot.com/2013/06/caldera.html.")
     st.markdown("### Desarrollo visual")
     st.video("https://youtu.be/CuOPVWsVw5Q?si=VHYeOAiwX5XSV2kJ")
@@ -276,11 +228,11 @@ st.markdown("---")
 st.sidebar.header("Parámetros de Entrada")
 unit_system = st.sidebar.radio(
     "Seleccione el Sistema de Unidades",
-    ('Sistema Internacional (SI)', 'Sistema Inglés (Imperial)')
+    (SI, IMPERIAL)
 )
 
 # Entradas dinámicas
-if unit_system == 'Sistema Internacional (SI)':
+if unit_system == SI:
     p_in = st.sidebar.slider("Presión del Proceso [MPa]", 0.1, 25.0, 5.0, 0.1)
     t_in = st.sidebar.slider("Temp. Entrada [°C]", 10.0, 1300.0, 60.0, 1.0)
     t_out = st.sidebar.slider("Temp. Salida [°C]", 100.0, 1300.0, 450.0, 1.0)
@@ -297,69 +249,52 @@ else:  # Sistema Inglés
 
 # --- Lógica Principal ---
 p_out = p_in  # Se asume presión constante
-resultados = calcular_propiedades_caldera(
-    p_in, t_in, t_out, v_out, d_val, unit_system)
-
-# --- Presentación de Resultados ---
-if resultados.get("error"):
-    st.error(f"**Error de Cálculo:** {resultados['error']}")
-    st.warning(
-        "Algunas combinaciones de presión y temperatura no son físicamente posibles. Intenta ajustar los valores.")
-else:
-    units = resultados['units']
-    st.header("📊 Resultados del Análisis")
-    st.markdown("---")
-
-    st.subheader("🎯 Objetivos Principales")
-    col_res1, col_res2, col_res3 = st.columns(3)
-
-    with col_res1:
-        st.markdown(f"""
-        <div class='resultado-final'>
-            <strong>Flujo Másico (ṁ):</strong><br>
-            {resultados['flujo_masico']:.2f} {units['mass_flow']}
-        </div>
-        """, unsafe_allow_html=True)
-    with col_res2:
-        st.markdown(f"""
-        <div class='resultado-final'>
-            <strong>Velocidad de Entrada (V₁):</strong><br>
-            {resultados['velocidad_entrada']:.2f} {units['velocity']}
-        </div>
-        """, unsafe_allow_html=True)
-    with col_res3:
-        st.markdown(f"""
-        <div class='resultado-final'>
-            <strong>Flujo Volumétrico Entrada (V̇):</strong><br>
-            {resultados['flujo_volumetrico_entrada']:.4f} {units['volume_flow']}
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-    st.subheader("📘 Propiedades Calculadas")
-    info_col1, info_col2, info_col3 = st.columns(3)
-
-    with info_col1:
-        st.markdown(f"""
-        <div class='resultado-final'>
-            <strong>Área del Tubo (A):</strong><br>
-            {resultados['area']:.5f} {units['area']}
-        </div>
-        """, unsafe_allow_html=True)
-    with info_col2:
-        st.markdown(f"""
-        <div class='resultado-final'>
-            <strong>Vol. Específico Entrada (v₁):</strong><br>
-            {resultados['v_especifico_entrada']:.6f} {units['spec_vol']}
-        </div>
-        """, unsafe_allow_html=True)
-    with info_col3:
-        st.markdown(f"""
-        <div class='resultado-final'>
-            <strong>Vol. Específico Salida (v₂):</strong><br>
-            {resultados['v_especifico_salida']:.5f} {units['spec_vol']}
-        </div>
-        """, unsafe_allow_html=True)
+
+
+# --- Panel de resultados ---
+def _results_panel(
+    p_in: float, t_in: float, t_out: float, v_out: float, d_val: float, unit_system: str
+) -> None:
+    """
+    Calcula y muestra los resultados de la caldera.
+    """
+    # Se redondea al paso de los deslizadores para que valores casi idénticos
+    # compartan la misma entrada de caché
+    calculo = calcular_propiedades_caldera(*entradas_a_si(
+        round(p_in, 1), round(t_in, 1), round(t_out, 1), round(v_out, 1),
+        round(d_val, 1), unit_system))
+
+    # --- Presentación de Resultados ---
+    if calculo.get("error"):
+        st.error(f"**Error de Cálculo:** {calculo['error']}")
+        st.warning(
+            "Algunas combinaciones de presión y temperatura no son físicamente posibles. Intenta ajustar los valores.")
+    else:
+        units = UNITS[unit_system]
+        resultados = calculo[unit_system]
+        st.header("📊 Resultados del Análisis")
+        st.markdown("---")
+
+        st.subheader("🎯 Objetivos Principales")
+        st.html(fila_de_tarjetas([
+            ("Flujo Másico (ṁ):", f"{resultados['flujo_masico']:.2f} {units['mass_flow']}"),
+            ("Velocidad de Entrada (V₁):", f"{resultados['velocidad_entrada']:.2f} {units['velocity']}"),
+            ("Flujo Volumétrico Entrada (V̇):",
+             f"{resultados['flujo_volumetrico_entrada']:.4f} {units['volume_flow']}"),
+        ]))
+
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.subheader("📘 Propiedades Calculadas")
+        st.html(fila_de_tarjetas([
+            ("Área del Tubo (A):", f"{resultados['area']:.5f} {units['area']}"),
+            ("Vol. Específico Entrada (v₁):",
+             f"{resultados['v_especifico_entrada']:.6f} {units['spec_vol']}"),
+            ("Vol. Específico Salida (v₂):",
+             f"{resultados['v_especifico_salida']:.5f} {units['spec_vol']}"),
+        ]))
+
+
+_results_panel(p_in, t_in, t_out, v_out, d_val, unit_system)
 
 
 st.markdown("""
@@ -1,176 +1,228 @@
 
 # -*- coding: utf-8 -*-
+import numpy as np
 import streamlit as st
-from iapws import IAPWS97
+from types import MappingProxyType
 from typing import Dict, Any
+from propiedades import pt_valido, saturacion_valida, vh_pt, vh_px
+from recursos import cargar_imagen
+from styles import fila_de_tarjetas, inject_theme, tarjetas
+
+# --- Factores de Conversión ---
+KGS_TO_LBMS = 2.20462
+MPA_TO_PSI = 145.038
+KPA_TO_PSI = 0.145038
+MS_TO_FTS = 3.28084
+M2_TO_FT2 = 10.7639
+M3KG_TO_FT3LBM = 16.0185
+KJ_KG_TO_BTU_LBM = 0.429923
+KW_TO_HP = 1.34102
+
+# Factores inversos (Inglés → SI): se multiplica en lugar de dividir
+LBMS_TO_KGS = 1.0 / KGS_TO_LBMS
+PSI_TO_MPA = 1.0 / MPA_TO_PSI
+PSI_TO_KPA = 1.0 / KPA_TO_PSI
+FTS_TO_MS = 1.0 / MS_TO_FTS
+BTU_LBM_TO_KJ_KG = 1.0 / KJ_KG_TO_BTU_LBM
+DEGF_TO_DEGC = 5.0 / 9.0
+KPA_TO_MPA = 0.001
+
+# Orden de los resultados y factor SI → Inglés de cada uno
+_RESULTADOS = ("delta_ec", "h1", "v1", "A1", "h2", "v2", "A2", "delta_h",
+               "Wt_I", "Wt_II", "Wt_III", "Wt_IV")
+_SI_FACTORS = np.ones(len(_RESULTADOS))
+_IMP_FACTORS = np.array([
+    KJ_KG_TO_BTU_LBM, KJ_KG_TO_BTU_LBM, M3KG_TO_FT3LBM, M2_TO_FT2,
+    KJ_KG_TO_BTU_LBM, M3KG_TO_FT3LBM, M2_TO_FT2, KJ_KG_TO_BTU_LBM,
+    KW_TO_HP, KW_TO_HP, KW_TO_HP, KW_TO_HP,
+])
+
+# --- Unidades de cada sistema (constantes de sólo lectura) ---
+_UNITS_SI = MappingProxyType({
+    "mass_flow": "kg/s", "pressure_mpa": "MPa", "pressure_kpa": "kPa",
+    "temperature": "°C", "velocity": "m/s", "quality": "",
+    "heat_loss": "kJ/kg", "area": "m²", "enthalpy": "kJ/kg",
+    "spec_vol": "m³/kg", "spec_energy": "kJ/kg", "power": "kW"
+})
+_UNITS_IMP = MappingProxyType({
+    "mass_flow": "lbm/s", "pressure_mpa": "psi", "pressure_kpa": "psi",
+    "temperature": "°F", "velocity": "ft/s", "quality": "",
+    "heat_loss": "Btu/lbm", "area": "ft²", "enthalpy": "Btu/lbm",
+    "spec_vol": "ft³/lbm", "spec_energy": "Btu/lbm", "power": "hp"
+})
+
+# --- Teoría (HTML estático con las ecuaciones ya escritas en MathML) ---
+THEORY_TURBINA_HTML = """
+<details class="teoria">
+<summary>📘 Fundamentos Termodinámicos de Turbinas (Çengel, 7ª ed.)</summary>
+<p>Las <b>turbinas</b> son dispositivos que convierten la energía contenida en un fluido en <b>trabajo mecánico útil</b>. Se utilizan ampliamente en <b>centrales térmicas y hidroeléctricas</b>, donde impulsan generadores eléctricos.</p>
+<p>En una turbina, el fluido realiza trabajo al expandirse y empujar los <b>álabes</b> conectados a un eje giratorio, provocando su rotación. El dispositivo entonces produce trabajo al entorno (<i>Ẇ</i><sub>salida</sub> &gt; 0).</p>
+<p>Desde el punto de vista energético, el análisis ideal de una turbina considera que:</p>
+<ul>
+<li>No hay <b>transferencia significativa de calor</b> (<i>Q̇</i> ≈ 0), debido al buen aislamiento térmico.</li>
+<li>No hay cambio apreciable de <b>energía potencial</b> ni de <b>energía cinética</b> (Δ<i>ep</i> ≈ 0, Δ<i>ec</i> ≈ 0).</li>
+</ul>
+<p>Por lo tanto, la <b>Primera Ley de la Termodinámica</b> (para flujo estable) se simplifica como:</p>
+<math display="block"><msub><mover><mi>W</mi><mo>˙</mo></mover><mtext>turbina</mtext></msub><mo>=</mo>
+<mover><mi>m</mi><mo>˙</mo></mover><mo>(</mo><msub><mi>h</mi><mn>1</mn></msub><mo>−</mo><msub><mi>h</mi><mn>2</mn></msub><mo>)</mo></math>
+<p>donde:</p>
+<ul>
+<li><i>Ẇ</i><sub>turbina</sub> es el <b>trabajo generado por unidad de tiempo</b></li>
+<li><i>ṁ</i> es el <b>flujo másico</b></li>
+<li><i>h</i><sub>1</sub> y <i>h</i><sub>2</sub> son las <b>entalpías específicas</b> de entrada y salida</li>
+</ul>
+<p>Este modelo permite estimar el trabajo que se puede obtener a partir de la caída de entalpía del fluido durante su paso por la turbina.</p>
+<p>📚 <b>Fuente</b>: Çengel, Yunus A., <i>Termodinámica</i>, 7ª Edición, McGraw-Hill, Sección 5.5 "Turbinas", pp. 279–280.</p>
+</details>
+"""
 
 # --- Estilos CSS Personalizados ---
-custom_css = """
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-        min-height: 100px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        margin-bottom: 10px;
-    }
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
-
-# --- Configuración de la Página ---
-try:
-    st.set_page_config(
-        page_title="Análisis de Turbina",
-        layout="centered",
-        initial_sidebar_state="expanded"
-    )
-except st.errors.StreamlitAPIException as e:
-    if "st.set_page_config() can only be called once per app" not in str(e):
-        raise e
+inject_theme(".resultado-final { min-height: 100px; margin-bottom: 10px; }")
 
 # ==============================================================================
 # 1. FUNCIÓN DE CÁLCULO PRINCIPAL
 # ==============================================================================
 
 
-@st.cache_data
-def analizar_turbina(
-    m_dot_in: float, P1_in: float, T1_in: float, V1_in: float,
-    P2_in: float, x2_in: float, V2_in: float,
-    q_loss_I_in: float, q_loss_II_in: float,
-    unit_system: str
-) -> Dict[str, Any]:
+def _entradas_a_si(
+    m_dot_in, P1_in, T1_in, V1_in, P2_in, x2_in, V2_in,
+    q_loss_I_in, q_loss_II_in, unit_system: str
+) -> tuple:
     """
-    Realiza el análisis termodinámico de la turbina, manejando unidades SI e Inglesas.
+    Convierte las entradas de la barra lateral a SI (kg/s, MPa, °C, m/s, kJ/kg).
     """
-    # --- Factores de Conversión ---
-    KGS_TO_LBMS = 2.20462
-    MPA_TO_PSI = 145.038
-    KPA_TO_PSI = 0.145038
-    MS_TO_FTS = 3.28084
-    M2_TO_FT2 = 10.7639
-    M3KG_TO_FT3LBM = 16.0185
-    KJ_KG_TO_BTU_LBM = 0.429923
-    KW_TO_HP = 1.34102
-
-    # --- Definición de Unidades y Conversión de Entradas ---
-    units = {}
     if unit_system == 'Sistema Internacional (SI)':
-        units = {
-            "mass_flow": "kg/s", "pressure_mpa": "MPa", "pressure_kpa": "kPa",
-            "temperature": "°C", "velocity": "m/s", "quality": "",
-            "heat_loss": "kJ/kg", "area": "m²", "enthalpy": "kJ/kg",
-            "spec_vol": "m³/kg", "spec_energy": "kJ/kg", "power": "kW"
-        }
-        m_dot_kgs = m_dot_in
-        P1_mpa = P1_in
-        T1_c = T1_in
-        V1_ms = V1_in
-        P2_kpa = P2_in
-        x2 = x2_in
-        V2_ms = V2_in
-        q_loss_I_kjkg = q_loss_I_in
-        q_loss_II_kjkg = q_loss_II_in
-    else:  # Sistema Inglés (Imperial)
-        units = {
-            "mass_flow": "lbm/s", "pressure_mpa": "psi", "pressure_kpa": "psi",
-            "temperature": "°F", "velocity": "ft/s", "quality": "",
-            "heat_loss": "Btu/lbm", "area": "ft²", "enthalpy": "Btu/lbm",
-            "spec_vol": "ft³/lbm", "spec_energy": "Btu/lbm", "power": "hp"
-        }
-        m_dot_kgs = m_dot_in / KGS_TO_LBMS
-        P1_mpa = P1_in / MPA_TO_PSI
-        T1_c = (T1_in - 32) * 5/9
-        V1_ms = V1_in / MS_TO_FTS
-        P2_kpa = P2_in / KPA_TO_PSI
-        x2 = x2_in
-        V2_ms = V2_in / MS_TO_FTS
-        q_loss_I_kjkg = q_loss_I_in / KJ_KG_TO_BTU_LBM
-        q_loss_II_kjkg = q_loss_II_in / KJ_KG_TO_BTU_LBM
+        return (m_dot_in, P1_in, T1_in, V1_in, P2_in * KPA_TO_MPA, x2_in, V2_in,
+                q_loss_I_in, q_loss_II_in)
+    # Sistema Inglés (Imperial)
+    return (m_dot_in * LBMS_TO_KGS, P1_in * PSI_TO_MPA, (T1_in - 32) * DEGF_TO_DEGC,
+            V1_in * FTS_TO_MS, P2_in * PSI_TO_KPA * KPA_TO_MPA, x2_in, V2_in * FTS_TO_MS,
+            q_loss_I_in * BTU_LBM_TO_KJ_KG, q_loss_II_in * BTU_LBM_TO_KJ_KG)
 
-    try:
-        # --- Cálculos Internos (siempre en SI) ---
-        P2_mpa = P2_kpa / 1000.0
-        T1_k = T1_c + 273.15
 
-        delta_ec_kjkg = (V2_ms**2 - V1_ms**2) / 2000.0
+def _turbina_si(
+    m_dot_kgs, P1_mpa, T1_c, V1_ms, P2_mpa, x2, V2_ms,
+    q_loss_I_kjkg, q_loss_II_kjkg
+) -> Dict[str, Any]:
+    """
+    Física de la turbina en SI, independiente del sistema de unidades mostrado.
+    Todas las operaciones son de NumPy, así que las entradas pueden ser escalares
+    o arreglos (un resultado por punto de operación). Devuelve los resultados
+    apilados en el orden de `_RESULTADOS`.
+    """
+    if not (pt_valido(P1_mpa, T1_c) and saturacion_valida(P2_mpa)
+            and np.all((x2 >= 0) & (x2 <= 1))):
+        return {"error": "El estado de entrada o de salida está fuera del rango de validez de IAPWS-IF97."}
+
+    try:
+        delta_ec_kjkg = (V2_ms * V2_ms - V1_ms * V1_ms) * 5e-4  # ÷ 2000 (J → kJ y ½)
 
-        state1 = IAPWS97(P=P1_mpa, T=T1_k)
-        h1_kjkg = state1.h
-        v1_m3kg = state1.v
-        A1_m2 = m_dot_kgs * v1_m3kg / V1_ms
+        # Propiedades IAPWS-IF97 (tablas precalculadas para arreglos)
+        v1_m3kg, h1_kjkg = vh_pt(P1_mpa, T1_c)
+        if not np.all(v1_m3kg > 0):
+            raise ValueError(f"estado 1 fuera de rango (código {v1_m3kg})")
+        # A = ṁ·v/V con ṁ/V agrupado: en los barridos ṁ y V son escalares, así que
+        # la división se hace una sola vez y sobre el arreglo queda un producto
+        A1_m2 = (m_dot_kgs / V1_ms) * v1_m3kg
 
-        state2 = IAPWS97(P=P2_mpa, x=x2)
-        h2_kjkg = state2.h
-        v2_m3kg = state2.v
-        A2_m2 = m_dot_kgs * v2_m3kg / V2_ms
+        v2_m3kg, h2_kjkg = vh_px(P2_mpa, x2)
+        if not np.all(v2_m3kg > 0):
+            raise ValueError(f"estado 2 fuera de rango (código {v2_m3kg})")
+        A2_m2 = (m_dot_kgs / V2_ms) * v2_m3kg
 
         delta_h_kjkg = h1_kjkg - h2_kjkg
 
-        Q_dot_I_kw = -q_loss_I_kjkg * m_dot_kgs
-        Wt_I_kw = m_dot_kgs * (delta_h_kjkg - delta_ec_kjkg) + Q_dot_I_kw
+        # Términos comunes de los cuatro casos de potencia, calculados una vez
+        m_dh_kw = m_dot_kgs * delta_h_kjkg
+        m_dh_ec_kw = m_dh_kw - m_dot_kgs * delta_ec_kjkg
 
+        Q_dot_I_kw = -q_loss_I_kjkg * m_dot_kgs
         Q_dot_II_kw = -q_loss_II_kjkg * m_dot_kgs
-        Wt_II_kw = m_dot_kgs * delta_h_kjkg + Q_dot_II_kw
-
-        Wt_III_kw = m_dot_kgs * (delta_h_kjkg - delta_ec_kjkg)
-        Wt_IV_kw = m_dot_kgs * delta_h_kjkg
-
-        # --- Conversión de Resultados a Unidades Seleccionadas ---
-        if unit_system == 'Sistema Inglés (Imperial)':
-            delta_ec_final = delta_ec_kjkg * KJ_KG_TO_BTU_LBM
-            h1_final, h2_final = h1_kjkg * KJ_KG_TO_BTU_LBM, h2_kjkg * KJ_KG_TO_BTU_LBM
-            v1_final, v2_final = v1_m3kg * M3KG_TO_FT3LBM, v2_m3kg * M3KG_TO_FT3LBM
-            A1_final, A2_final = A1_m2 * M2_TO_FT2, A2_m2 * M2_TO_FT2
-            delta_h_final = delta_h_kjkg * KJ_KG_TO_BTU_LBM
-            Wt_I, Wt_II, Wt_III, Wt_IV = Wt_I_kw * KW_TO_HP, Wt_II_kw * \
-                KW_TO_HP, Wt_III_kw * KW_TO_HP, Wt_IV_kw * KW_TO_HP
-        else:
-            delta_ec_final = delta_ec_kjkg
-            h1_final, h2_final = h1_kjkg, h2_kjkg
-            v1_final, v2_final = v1_m3kg, v2_m3kg
-            A1_final, A2_final = A1_m2, A2_m2
-            delta_h_final = delta_h_kjkg
-            Wt_I, Wt_II, Wt_III, Wt_IV = Wt_I_kw, Wt_II_kw, Wt_III_kw, Wt_IV_kw
-
-        return {
-            "delta_ec": delta_ec_final, "h1": h1_final, "v1": v1_final, "A1": A1_final,
-            "h2": h2_final, "v2": v2_final, "A2": A2_final, "delta_h": delta_h_final,
-            "Wt_I": Wt_I, "Wt_II": Wt_II, "Wt_III": Wt_III, "Wt_IV": Wt_IV,
-            "units": units, "error": None
-        }
+
+        Wt_I_kw = m_dh_ec_kw + Q_dot_I_kw     # Con pérdida de calor y ΔEc
+        Wt_II_kw = m_dh_kw + Q_dot_II_kw      # Con pérdida de calor y sin ΔEc
+        Wt_III_kw = m_dh_ec_kw                # Adiabática y con ΔEc
+        Wt_IV_kw = m_dh_kw                    # Adiabática y sin ΔEc
+
+        # Una fila por resultado; con arreglos, una columna por punto
+        si = np.array(np.broadcast_arrays(
+            delta_ec_kjkg, h1_kjkg, v1_m3kg, A1_m2, h2_kjkg, v2_m3kg,
+            A2_m2, delta_h_kjkg, Wt_I_kw, Wt_II_kw, Wt_III_kw, Wt_IV_kw))
+        return {"si": si, "error": None}
     except Exception as e:
         return {"error": str(e)}
 
+
+@st.cache_data(max_entries=128)
+def _solve_si(
+    m_dot_kgs: float, P1_mpa: float, T1_c: float, V1_ms: float,
+    P2_mpa: float, x2: float, V2_ms: float,
+    q_loss_I_kjkg: float, q_loss_II_kjkg: float
+) -> Dict[str, Any]:
+    """
+    Parte costosa (estados IAPWS-IF97) de un único punto, en caché por entradas
+    SI: cambiar de sistema de unidades no invalida la entrada.
+    """
+    return _turbina_si(m_dot_kgs, P1_mpa, T1_c, V1_ms, P2_mpa, x2, V2_ms,
+                       q_loss_I_kjkg, q_loss_II_kjkg)
+
+
+def _a_unidades(calculo: Dict[str, Any], unit_system: str) -> Dict[str, Any]:
+    """
+    Convierte los resultados SI al sistema de unidades seleccionado.
+    """
+    if calculo.get("error"):
+        return calculo
+
+    # --- Definición de Unidades ---
+    if unit_system == 'Sistema Internacional (SI)':
+        units, factores = _UNITS_SI, _SI_FACTORS
+    else:  # Sistema Inglés (Imperial)
+        units, factores = _UNITS_IMP, _IMP_FACTORS
+
+    # --- Conversión de Resultados a Unidades Seleccionadas ---
+    # Un solo producto vectorizado en lugar de una multiplicación por valor
+    resultados = dict(zip(_RESULTADOS, (calculo["si"].T * factores).T))
+    resultados.update(units=units, error=None)
+    return resultados
+
+
+def analizar_turbina(
+    m_dot_in: float, P1_in: float, T1_in: float, V1_in: float,
+    P2_in: float, x2_in: float, V2_in: float,
+    q_loss_I_in: float, q_loss_II_in: float,
+    unit_system: str
+) -> Dict[str, Any]:
+    """
+    Realiza el análisis termodinámico de la turbina, manejando unidades SI e Inglesas.
+    Sólo el cálculo SI está en caché; la conversión de unidades es inmediata.
+    """
+    entradas_si = _entradas_a_si(m_dot_in, P1_in, T1_in, V1_in, P2_in, x2_in, V2_in,
+                                 q_loss_I_in, q_loss_II_in, unit_system)
+    return _a_unidades(_solve_si(*entradas_si), unit_system)
+
+
+@st.cache_data(max_entries=32)
+def _solve_si_batch(*entradas_si) -> Dict[str, Any]:
+    """
+    Parte costosa de un lote de puntos, en caché por entradas SI.
+    """
+    return _turbina_si(*entradas_si)
+
+
+def analizar_turbina_batch(
+    m_dot_in, P1_in, T1_in, V1_in, P2_in, x2_in, V2_in,
+    q_loss_I_in, q_loss_II_in, unit_system: str
+) -> Dict[str, Any]:
+    """
+    Análisis de un lote de puntos de operación: cualquier entrada puede ser una
+    lista o arreglo. Las propiedades se interpolan en las tablas IAPWS-IF97 y el
+    resto de la aritmética se hace elemento a elemento con NumPy.
+    """
+    entradas = [np.asarray(e, dtype=np.float64) for e in (
+        m_dot_in, P1_in, T1_in, V1_in, P2_in, x2_in, V2_in, q_loss_I_in, q_loss_II_in)]
+    return _a_unidades(_solve_si_batch(*_entradas_a_si(*entradas, unit_system)), unit_system)
+
 # ==============================================================================
 # 2. INTERFAZ GRÁFICA CON STREAMLIT
 # ==============================================================================
@@ -179,7 +231,7 @@ def analizar_turbina(
 # --- Configuración de la página ---
 col_img, col_title = st.columns([0.2, 1])
 with col_img:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Turbina%20y%20flecha%20en%20contraste.png", width=200)
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Turbina%20y%20flecha%20en%20contraste.png"), width=200)
 with col_title:
     st.title("Turbina: Análisis Interactivo de Expansión de Vapor")
 st.markdown(
@@ -190,31 +242,7 @@ st.write("---")
 # =========================
 # 📘 Teoría
 # =========================
-with st.expander("📘 Fundamentos Termodinámicos de Turbinas (Çengel, 7ª ed.)"):
-    st.markdown(r"""
-Las **turbinas** son dispositivos que convierten la energía contenida en un fluido en **trabajo mecánico útil**. Se utilizan ampliamente en **centrales térmicas y hidroeléctricas**, donde impulsan generadores eléctricos.
-
-En una turbina, el fluido realiza trabajo al expandirse y empujar los **álabes** conectados a un eje giratorio, provocando su rotación. El dispositivo entonces produce trabajo al entorno ($\dot{W}_{\text{salida}} > 0$).
-
-Desde el punto de vista energético, el análisis ideal de una turbina considera que:
-- No hay **transferencia significativa de calor** ($\dot{Q} \approx 0$), debido al buen aislamiento térmico.
-- No hay cambio apreciable de **energía potencial** ni de **energía cinética** ($\Delta ep \approx 0$, $\Delta ec \approx 0$).
-
-Por lo tanto, la **Primera Ley de la Termodinámica** (para flujo estable) se simplifica como:
-
-$$
-\dot{W}_{\text{turbina}} = \dot{m}(h_1 - h_2)
-$$
-
-donde:
-- $\dot{W}_{\text{turbina}}$ es el **trabajo generado por unidad de tiempo**
-- $\dot{m}$ es el **flujo másico**
-- $h_1$ y $h_2$ son las **entalpías específicas** de entrada y salida
-
-Este modelo permite estimar el trabajo que se puede obtener a partir de la caída de entalpía del fluido durante su paso por la turbina.
-
-📚 **Fuente**: Çengel, Yunus A., *Termodinámica*, 7ª Edición, McGraw-Hill, Sección 5.5 "Turbinas", pp. 279–280.
-""")
+st.html(THEORY_TURBINA_HTML)
 
 
 # =========================
@@ -256,7 +284,7 @@ Se pide calcular:
 **Fuente:** *Ejercicio tomado y adaptado de **LaMejorAsesoríaEducativa – YouTube***.
 """)
 with col2:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/TurbinaBook.png",
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/TurbinaBook.png"),
              caption="**FIGURA 5-25** – FIGURA 5-28** – Esquema de turbina.\\n\\nFuente: Çengel – Termodinámica, 7ª Edición.")
     st.markdown("### Desarrollo visual")
     st.video("https://youtu.be/_n2ozXyNBSc?si=5XJVptZt_PPEl59Y")
@@ -301,9 +329,35 @@ else:  # Sistema Inglés
     q_loss_II = st.sidebar.number_input(
         "Pérdida Caso II (q) [Btu/lbm]", 0.0, 100.0, 34.4, 1.0)
 
+# --- Barrido de un parámetro (análisis por lotes) ---
+# Etiqueta → (entrada que se barre, mínimo, máximo) con los rangos de los deslizadores
+RANGOS_BARRIDO = {
+    'Sistema Internacional (SI)': {
+        "Presión (P₁) [MPa]": ("P1", 1.0, 15.0),
+        "Temperatura (T₁) [°C]": ("T1", 200.0, 600.0),
+        "Presión (P₂) [kPa]": ("P2", 10.0, 200.0),
+        "Calidad de Vapor (x₂)": ("x2", 0.0, 1.0),
+    },
+    'Sistema Inglés (Imperial)': {
+        "Presión (P₁) [psi]": ("P1", 150.0, 2200.0),
+        "Temperatura (T₁) [°F]": ("T1", 400.0, 1100.0),
+        "Presión (P₂) [psi]": ("P2", 1.5, 30.0),
+        "Calidad de Vapor (x₂)": ("x2", 0.0, 1.0),
+    },
+}
+N_PUNTOS_BARRIDO = 60
+
+st.sidebar.subheader("Barrer Parámetro")
+parametro_barrido = st.sidebar.selectbox(
+    "Parámetro a barrer", ["Ninguno"] + list(RANGOS_BARRIDO[unit_system]))
+
 # --- Ejecución y Presentación de Resultados ---
+# Se redondea a la resolución de los controles para que valores casi idénticos
+# compartan la misma entrada de caché
 resultados = analizar_turbina(
-    m_dot, P1, T1, V1, P2, x2, V2, q_loss_I, q_loss_II, unit_system)
+    round(m_dot, 3), round(P1, 3), round(T1, 3), round(V1, 3),
+    round(P2, 3), round(x2, 2), round(V2, 3),
+    round(q_loss_I, 3), round(q_loss_II, 3), unit_system)
 
 st.divider()
 
@@ -311,43 +365,65 @@ if resultados.get("error"):
     st.error(f"**Error en el cálculo:** {resultados['error']}")
 else:
     units = resultados['units']
+    # Cada bloque de tarjetas se emite con una sola llamada
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Propiedades en la Entrada (1)")
-        st.markdown(
-            f"<div class='resultado-final'><strong>Entalpía (h₁):</strong><br>{resultados['h1']:.2f} {units['enthalpy']}</div>", unsafe_allow_html=True)
-        st.markdown(
-            f"<div class='resultado-final'><strong>Área (A₁):</strong><br>{resultados['A1']:.4f} {units['area']}</div>", unsafe_allow_html=True)
+        st.html(tarjetas([
+            ("Entalpía (h₁):", f"{resultados['h1']:.2f} {units['enthalpy']}"),
+            ("Área (A₁):", f"{resultados['A1']:.4f} {units['area']}"),
+        ]))
     with col2:
         st.subheader("Propiedades en la Salida (2)")
-        st.markdown(
-            f"<div class='resultado-final'><strong>Entalpía (h₂):</strong><br>{resultados['h2']:.2f} {units['enthalpy']}</div>", unsafe_allow_html=True)
-        st.markdown(
-            f"<div class='resultado-final'><strong>Área (A₂):</strong><br>{resultados['A2']:.4f} {units['area']}</div>", unsafe_allow_html=True)
+        st.html(tarjetas([
+            ("Entalpía (h₂):", f"{resultados['h2']:.2f} {units['enthalpy']}"),
+            ("Área (A₂):", f"{resultados['A2']:.4f} {units['area']}"),
+        ]))
 
     st.divider()
     st.subheader("Cambios de Energía Específica")
-    c1, c2 = st.columns(2)
-    with c1:
-        st.markdown(
-            f"<div class='resultado-final'><strong>Δh (h₁ - h₂):</strong><br>{resultados['delta_h']:.2f} {units['enthalpy']}</div>", unsafe_allow_html=True)
-    with c2:
-        st.markdown(
-            f"<div class='resultado-final'><strong>Δec:</strong><br>{resultados['delta_ec']:.2f} {units['spec_energy']}</div>", unsafe_allow_html=True)
+    st.html(fila_de_tarjetas([
+        ("Δh (h₁ - h₂):", f"{resultados['delta_h']:.2f} {units['enthalpy']}"),
+        ("Δec:", f"{resultados['delta_ec']:.2f} {units['spec_energy']}"),
+    ]))
 
     st.divider()
     st.header(f"⚡ Potencia Generada por la Turbina (Ẇt)")
-    r1, r2 = st.columns(2)
-    with r1:
-        st.markdown(
-            f"<div class='resultado-final'><strong>I. Con Pérdida de Calor y ΔEc</strong><br>Potencia: {resultados['Wt_I']:.2f} {units['power']}</div>", unsafe_allow_html=True)
-        st.markdown(
-            f"<div class='resultado-final'><strong>III. Adiabática y con ΔEc</strong><br>Potencia: {resultados['Wt_III']:.2f} {units['power']}</div>", unsafe_allow_html=True)
-    with r2:
-        st.markdown(
-            f"<div class='resultado-final'><strong>II. Con Pérdida de Calor y sin ΔEc</strong><br>Potencia: {resultados['Wt_II']:.2f} {units['power']}</div>", unsafe_allow_html=True)
-        st.markdown(
-            f"<div class='resultado-final'><strong>IV. Adiabática y sin ΔEc</strong><br>Potencia: {resultados['Wt_IV']:.2f} {units['power']}</div>", unsafe_allow_html=True)
+    st.html(
+        fila_de_tarjetas([
+            ("I. Con Pérdida de Calor y ΔEc", f"Potencia: {resultados['Wt_I']:.2f} {units['power']}"),
+            ("II. Con Pérdida de Calor y sin ΔEc", f"Potencia: {resultados['Wt_II']:.2f} {units['power']}"),
+        ])
+        + fila_de_tarjetas([
+            ("III. Adiabática y con ΔEc", f"Potencia: {resultados['Wt_III']:.2f} {units['power']}"),
+            ("IV. Adiabática y sin ΔEc", f"Potencia: {resultados['Wt_IV']:.2f} {units['power']}"),
+        ])
+    )
+
+    if parametro_barrido != "Ninguno":
+        # Se evalúan todos los puntos del barrido en un solo lote
+        clave, minimo, maximo = RANGOS_BARRIDO[unit_system][parametro_barrido]
+        entradas = {"P1": round(P1, 3), "T1": round(T1, 3),
+                    "P2": round(P2, 3), "x2": round(x2, 2)}
+        valores = np.linspace(minimo, maximo, N_PUNTOS_BARRIDO)
+        entradas[clave] = valores
+        barrido = analizar_turbina_batch(
+            round(m_dot, 3), entradas["P1"], entradas["T1"], round(V1, 3),
+            entradas["P2"], entradas["x2"], round(V2, 3),
+            round(q_loss_I, 3), round(q_loss_II, 3), unit_system)
+
+        st.divider()
+        st.subheader(f"📈 Potencia vs. {parametro_barrido}")
+        if barrido.get("error"):
+            st.warning(f"No se pudo calcular el barrido: {barrido['error']}")
+        else:
+            st.line_chart({
+                parametro_barrido: valores,
+                "I. Con pérdida y ΔEc": barrido["Wt_I"],
+                "II. Con pérdida, sin ΔEc": barrido["Wt_II"],
+                "III. Adiabática, con ΔEc": barrido["Wt_III"],
+                "IV. Adiabática, sin ΔEc": barrido["Wt_IV"],
+            }, x=parametro_barrido, y_label=f"Potencia [{units['power']}]")
 
 st.markdown("""
 <div class='nota-info'>
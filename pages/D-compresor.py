@@ -1,159 +1,159 @@
 
 # -*- coding: utf-8 -*-
+import numpy as np
 import streamlit as st
 import math
+from types import MappingProxyType
 from typing import Dict, Any
+from recursos import cargar_imagen
+from styles import fila_de_tarjetas, inject_theme, tarjetas
+
+# --- Constantes para el Aire (en unidades SI) ---
+R_AIR_SI = 0.287  # kJ/kg·K
+CP_AIR_SI = 1.005  # kJ/kg·K
+
+# --- Factores de Conversión ---
+KGS_TO_LBMS = 2.20462
+KJ_KG_TO_BTU_LBM = 0.429923
+KPA_TO_PSI = 0.145038
+K_TO_R = 1.8
+MS_TO_FTS = 3.28084
+KW_TO_HP = 1.34102
+M3S_TO_FT3S = 35.3147
+KW_TO_BTUS = 0.947817  # kW to BTU/s
+
+# Factores inversos (Inglés → SI): se multiplica en lugar de dividir
+LBMS_TO_KGS = 1.0 / KGS_TO_LBMS
+BTU_LBM_TO_KJ_KG = 1.0 / KJ_KG_TO_BTU_LBM
+PSI_TO_KPA = 1.0 / KPA_TO_PSI
+R_TO_K = 1.0 / K_TO_R
+FTS_TO_MS = 1.0 / MS_TO_FTS
+
+# Orden de los resultados y factor SI → Inglés de cada uno
+_RESULTADOS = ("potencia_w", "flujo_volumetrico", "trabajo_por_masa",
+               "Q_dot", "delta_h", "delta_ec")
+_SI_FACTORS = np.ones(len(_RESULTADOS))
+_IMP_FACTORS = np.array([KW_TO_HP, M3S_TO_FT3S, KJ_KG_TO_BTU_LBM,
+                         KW_TO_BTUS, KJ_KG_TO_BTU_LBM, KJ_KG_TO_BTU_LBM])
+
+# --- Unidades de cada sistema (constantes de sólo lectura) ---
+_UNITS_SI = MappingProxyType({
+    "power": "kW", "volume_flow": "m³/s", "work_mass": "kJ/kg",
+    "heat_rate": "kW", "enthalpy_change": "kJ/kg", "ke_change": "kJ/kg"
+})
+_UNITS_IMP = MappingProxyType({
+    "power": "hp", "volume_flow": "ft³/s", "work_mass": "Btu/lbm",
+    "heat_rate": "Btu/s", "enthalpy_change": "Btu/lbm", "ke_change": "Btu/lbm"
+})
+
+# --- Teoría (HTML estático con las ecuaciones ya escritas en MathML) ---
+_W_COMPRESOR = "<msub><mover><mi>W</mi><mo>˙</mo></mover><mtext>compresor</mtext></msub>"
+_M_DOT = "<mover><mi>m</mi><mo>˙</mo></mover>"
+_DELTA_H = "<msub><mi>h</mi><mn>2</mn></msub><mo>−</mo><msub><mi>h</mi><mn>1</mn></msub>"
+
+THEORY_COMPRESOR_HTML = f"""
+<details class="teoria">
+<summary>📘 Fundamentos Termodinámicos de Compresores (Çengel, 7ª ed.)</summary>
+<p>Los <b>compresores</b> son dispositivos utilizados para <b>aumentar la presión de un gas</b> mediante el suministro de <b>trabajo mecánico</b> desde una fuente externa. Son fundamentales en sistemas de refrigeración, aire acondicionado, motores de combustión y procesos industriales.</p>
+<p>En un compresor, el fluido (generalmente un gas) recibe energía en forma de <b>trabajo de eje</b>. A diferencia de las turbinas, los compresores <b>no generan trabajo</b>, sino que lo <b>consumen</b>:</p>
+<math display="block"><msub><mover><mi>W</mi><mo>˙</mo></mover><mtext>entrada</mtext></msub><mo>&gt;</mo><mn>0</mn></math>
+<p>Los compresores se analizan generalmente bajo estas suposiciones ideales:</p>
+<ul>
+<li><b>Sin transferencia de calor significativa</b> (<i>Q̇</i> ≈ 0) → proceso adiabático</li>
+<li><b>Sin cambios importantes en energía potencial</b> (Δ<i>ep</i> ≈ 0)</li>
+<li><b>Cambios en energía cinética despreciables</b>, salvo que el gas se acelere notablemente (Δ<i>ec</i> ≈ 0)</li>
+</ul>
+<p>Aplicando la <b>Primera Ley de la Termodinámica</b> para flujo estacionario:</p>
+<math display="block">{_W_COMPRESOR}<mo>=</mo>{_M_DOT}<mrow><mo>(</mo>{_DELTA_H}<mo>+</mo>
+<mfrac><mrow><msubsup><mi>V</mi><mn>2</mn><mn>2</mn></msubsup><mo>−</mo><msubsup><mi>V</mi><mn>1</mn><mn>2</mn></msubsup></mrow><mn>2</mn></mfrac>
+<mo>+</mo><mi>g</mi><mo>(</mo><msub><mi>z</mi><mn>2</mn></msub><mo>−</mo><msub><mi>z</mi><mn>1</mn></msub><mo>)</mo><mo>)</mo></mrow></math>
+<p>Y si se considera un compresor <b>adiabático y sin variaciones de energía cinética ni potencial</b>, se simplifica a:</p>
+<math display="block">{_W_COMPRESOR}<mo>=</mo>{_M_DOT}<mo>(</mo>{_DELTA_H}<mo>)</mo></math>
+<p>donde:</p>
+<ul>
+<li><i>h</i> es la entalpía específica</li>
+<li><i>ṁ</i> es el flujo másico</li>
+<li><i>Ẇ</i><sub>compresor</sub> es el trabajo requerido por unidad de tiempo</li>
+</ul>
+<p>Este modelo permite calcular el <b>trabajo de compresión</b> requerido para lograr un aumento de presión y temperatura en el gas.</p>
+<p>📚 <b>Fuente</b>: Çengel, Yunus A., <i>Termodinámica</i>, 7ª Edición, McGraw-Hill, Sección 5.5 "Compresores", pp. 279–280.</p>
+</details>
+"""
 
 # --- Estilos CSS Personalizados ---
-custom_css = """
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-        min-height: 110px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        margin-bottom: 10px;
-    }
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
-
-# --- CONFIGURACIÓN DE LA PÁGINA ---
-try:
-    st.set_page_config(
-        page_title="Análisis de Compresor",
-        page_icon="⚙️",
-        layout="centered"
-    )
-except st.errors.StreamlitAPIException as e:
-    if "st.set_page_config() can only be called once per app" not in str(e):
-        raise e
+inject_theme(".resultado-final { min-height: 110px; margin-bottom: 10px; }")
 
 # ==============================================================================
 # 1. FUNCIÓN DE CÁLCULO PRINCIPAL
 # ==============================================================================
 
 
-@st.cache_data
-def analizar_compresor(
+@st.cache_data(max_entries=128)
+def _analizar_compresor(
     m_dot_in: float, q_out_in: float,
     P1_in: float, T1_in: float, V1_in: float,
     P2_in: float, T2_in: float, V2_in: float,
     unit_system: str
 ) -> Dict[str, Any]:
     """
-    Realiza el análisis termodinámico de un compresor de aire, manejando unidades SI e Inglesas.
+    Resultados numéricos del compresor en el sistema de unidades seleccionado.
     """
-    # --- Constantes para el Aire (en unidades SI) ---
-    R_air_si = 0.287  # kJ/kg·K
-    cp_air_si = 1.005  # kJ/kg·K
-
-    # --- Factores de Conversión ---
-    KGS_TO_LBMS = 2.20462
-    KJ_KG_TO_BTU_LBM = 0.429923
-    KPA_TO_PSI = 0.145038
-    K_TO_R = 1.8
-    MS_TO_FTS = 3.28084
-    KW_TO_HP = 1.34102
-    M3S_TO_FT3S = 35.3147
-    KW_TO_BTUS = 0.947817  # kW to BTU/s
-
-    # --- Definición de Unidades y Conversión de Entradas ---
-    units = {}
+    # --- Conversión de Entradas ---
     if unit_system == 'Sistema Internacional (SI)':
-        units = {
-            "power": "kW", "volume_flow": "m³/s", "work_mass": "kJ/kg",
-            "heat_rate": "kW", "enthalpy_change": "kJ/kg", "ke_change": "kJ/kg"
-        }
         m_dot_kgs = m_dot_in
         q_out_kjkg = q_out_in
         P1_kpa, T1_k, V1_ms = P1_in, T1_in, V1_in
         P2_kpa, T2_k, V2_ms = P2_in, T2_in, V2_in
     else:  # Sistema Inglés (Imperial)
-        units = {
-            "power": "hp", "volume_flow": "ft³/s", "work_mass": "Btu/lbm",
-            "heat_rate": "Btu/s", "enthalpy_change": "Btu/lbm", "ke_change": "Btu/lbm"
-        }
-        m_dot_kgs = m_dot_in / KGS_TO_LBMS
-        q_out_kjkg = q_out_in / KJ_KG_TO_BTU_LBM
-        P1_kpa = P1_in / KPA_TO_PSI
-        T1_k = T1_in / K_TO_R
-        V1_ms = V1_in / MS_TO_FTS
-        P2_kpa = P2_in / KPA_TO_PSI
-        T2_k = T2_in / K_TO_R
-        V2_ms = V2_in / MS_TO_FTS
+        m_dot_kgs = m_dot_in * LBMS_TO_KGS
+        q_out_kjkg = q_out_in * BTU_LBM_TO_KJ_KG
+        P1_kpa = P1_in * PSI_TO_KPA
+        T1_k = T1_in * R_TO_K
+        V1_ms = V1_in * FTS_TO_MS
+        P2_kpa = P2_in * PSI_TO_KPA
+        T2_k = T2_in * R_TO_K
+        V2_ms = V2_in * FTS_TO_MS
 
     # --- Cálculos Internos (siempre en SI) ---
     # a) Flujo volumétrico
-    V_dot_1_m3s = (m_dot_kgs * R_air_si * T1_k) / P1_kpa if P1_kpa > 0 else 0
+    V_dot_1_m3s = (m_dot_kgs * R_AIR_SI * T1_k) / P1_kpa if P1_kpa > 0 else 0
 
     # b) Potencia requerida
     Q_dot_kw = -m_dot_kgs * q_out_kjkg
-    delta_h_kjkg = cp_air_si * (T2_k - T1_k)
-    delta_ec_kjkg = (V2_ms**2 - V1_ms**2) / 2000.0
+    delta_h_kjkg = CP_AIR_SI * (T2_k - T1_k)
+    delta_ec_kjkg = (V2_ms * V2_ms - V1_ms * V1_ms) * 5e-4  # ÷ 2000 (J → kJ y ½)
     W_dot_kw = Q_dot_kw - m_dot_kgs * (delta_h_kjkg + delta_ec_kjkg)
 
     # c) Trabajo por unidad de masa
     w_kjkg = W_dot_kw / m_dot_kgs if m_dot_kgs > 0 else 0
 
     # --- Conversión de Resultados a Unidades Seleccionadas ---
-    if unit_system == 'Sistema Inglés (Imperial)':
-        potencia_final = W_dot_kw * KW_TO_HP
-        V_dot_1_final = V_dot_1_m3s * M3S_TO_FT3S
-        w_final = w_kjkg * KJ_KG_TO_BTU_LBM
-        Q_dot_final = Q_dot_kw * KW_TO_BTUS
-        delta_h_final = delta_h_kjkg * KJ_KG_TO_BTU_LBM
-        delta_ec_final = delta_ec_kjkg * KJ_KG_TO_BTU_LBM
-    else:
-        potencia_final = W_dot_kw
-        V_dot_1_final = V_dot_1_m3s
-        w_final = w_kjkg
-        Q_dot_final = Q_dot_kw
-        delta_h_final = delta_h_kjkg
-        delta_ec_final = delta_ec_kjkg
-
-    return {
-        "potencia_w": potencia_final,
-        "flujo_volumetrico": V_dot_1_final,
-        "trabajo_por_masa": w_final,
-        "Q_dot": Q_dot_final,
-        "delta_h": delta_h_final,
-        "delta_ec": delta_ec_final,
-        "units": units
-    }
+    # Un solo producto vectorizado en lugar de una multiplicación por valor
+    si = np.array([W_dot_kw, V_dot_1_m3s, w_kjkg, Q_dot_kw, delta_h_kjkg, delta_ec_kjkg])
+    factores = _IMP_FACTORS if unit_system == 'Sistema Inglés (Imperial)' else _SI_FACTORS
+
+    return dict(zip(_RESULTADOS, si * factores))
+
+
+def analizar_compresor(
+    m_dot_in: float, q_out_in: float,
+    P1_in: float, T1_in: float, V1_in: float,
+    P2_in: float, T2_in: float, V2_in: float,
+    unit_system: str
+) -> Dict[str, Any]:
+    """
+    Realiza el análisis termodinámico de un compresor de aire, manejando unidades SI e Inglesas.
+    Las unidades se añaden fuera de la caché (un MappingProxyType no se puede serializar).
+    """
+    resultados = _analizar_compresor(m_dot_in, q_out_in, P1_in, T1_in, V1_in,
+                                     P2_in, T2_in, V2_in, unit_system)
+    resultados["units"] = _UNITS_SI if unit_system == 'Sistema Internacional (SI)' else _UNITS_IMP
+    return resultados
 
 
 col_img, col_title = st.columns([0.2, 1])
 with col_img:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Compresor%20de%20aire%20ilustre.png", width=200)
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Compresor%20de%20aire%20ilustre.png"), width=200)
 with col_title:
     st.title("Compresor: Análisis Interactivo del Trabajo de Compresión")
 st.markdown("#### Explora cómo varían la presión, la temperatura y la entalpía del gas durante el proceso de compresión.")
@@ -162,42 +162,8 @@ st.markdown("#### Explora cómo varían la presión, la temperatura y la entalp
 # =========================
 # 📘 Teoría
 # =========================
-with st.expander("📘 Fundamentos Termodinámicos de Compresores (Çengel, 7ª ed.)"):
-    st.markdown(r"""
-Los **compresores** son dispositivos utilizados para **aumentar la presión de un gas** mediante el suministro de **trabajo mecánico** desde una fuente externa. Son fundamentales en sistemas de refrigeración, aire acondicionado, motores de combustión y procesos industriales.
-
-En un compresor, el fluido (generalmente un gas) recibe energía en forma de **trabajo de eje**. A diferencia de las turbinas, los compresores **no generan trabajo**, sino que lo **consumen**:
-
-$$
-\dot{W}_{\text{entrada}} > 0
-$$
-
-Los compresores se analizan generalmente bajo estas suposiciones ideales:
-- **Sin transferencia de calor significativa** ($\dot{Q} \approx 0$) → proceso adiabático
-- **Sin cambios importantes en energía potencial** ($\Delta ep \approx 0$)
-- **Cambios en energía cinética despreciables**, salvo que el gas se acelere notablemente ($\Delta ec \approx 0$)
-
-Aplicando la **Primera Ley de la Termodinámica** para flujo estacionario:
-
-$$
-\dot{W}_{\text{compresor}} = \dot{m} \left( h_2 - h_1 + \frac{V_2^2 - V_1^2}{2} + g(z_2 - z_1) \right)
-$$
+st.html(THEORY_COMPRESOR_HTML)
 
-Y si se considera un compresor **adiabático y sin variaciones de energía cinética ni potencial**, se simplifica a:
-
-$$
-\dot{W}_{\text{compresor}} = \dot{m}(h_2 - h_1)
-$$
-
-donde:
-- $h$ es la entalpía específica
-- $\dot{m}$ es el flujo másico
-- $\dot{W}_{\text{compresor}}$ es el trabajo requerido por unidad de tiempo
-
-Este modelo permite calcular el **trabajo de compresión** requerido para lograr un aumento de presión y temperatura en el gas.
-
-📚 **Fuente**: Çengel, Yunus A., *Termodinámica*, 7ª Edición, McGraw-Hill, Sección 5.5 "Compresores", pp. 279–280.
-""")
 
 col1, col2 = st.columns(2)
 with col1:
@@ -230,7 +196,7 @@ Determinar:
 """)
 
 with col2:
-    st.image("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Compresor.png",
+    st.image(cargar_imagen("https://raw.githubusercontent.com/Jmontoyaor/thermodynamics/main/IMAGENES/Compresor.png"),
              caption="**FIGURA 5-27 - Esquema de compresor\\n\\nFuente: Çengel – Termodinámica, 7ª Edición.")
     st.markdown("### Ejercicio adicional")
     st.video("https://www.youtube.com/watch?v=atcJEUzwVRk")
@@ -268,21 +234,19 @@ else:  # Sistema Inglés
     V2 = st.sidebar.slider("Velocidad (V₂) [ft/s]", 0.0, 330.0, 23.0, 1.0)
 
 # --- Ejecución y Presentación de Resultados ---
+# Se redondea a la resolución de los deslizadores para que valores casi
+# idénticos compartan la misma entrada de caché
 resultados = analizar_compresor(
-    m_dot, q_out, P1, T1, V1, P2, T2, V2, unit_system)
+    round(m_dot, 3), round(q_out, 3), round(P1, 3), round(T1, 3), round(V1, 3),
+    round(P2, 3), round(T2, 3), round(V2, 3), unit_system)
 units = resultados['units']
 
 st.header("📊 Resultados del Análisis")
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.markdown(
-        f"<div class='resultado-final'><strong>Potencia de Entrada (Ẇ):</strong><br>{resultados['potencia_w']:.3f} {units['power']}</div>", unsafe_allow_html=True)
-with col2:
-    st.markdown(
-        f"<div class='resultado-final'><strong>Flujo Volumétrico Entrada:</strong><br>{resultados['flujo_volumetrico']:.4f} {units['volume_flow']}</div>", unsafe_allow_html=True)
-with col3:
-    st.markdown(
-        f"<div class='resultado-final'><strong>Trabajo por Masa (w):</strong><br>{resultados['trabajo_por_masa']:.3f} {units['work_mass']}</div>", unsafe_allow_html=True)
+st.html(fila_de_tarjetas([
+    ("Potencia de Entrada (Ẇ):", f"{resultados['potencia_w']:.3f} {units['power']}"),
+    ("Flujo Volumétrico Entrada:", f"{resultados['flujo_volumetrico']:.4f} {units['volume_flow']}"),
+    ("Trabajo por Masa (w):", f"{resultados['trabajo_por_masa']:.3f} {units['work_mass']}"),
+]))
 
 st.markdown("<p style='text-align: center; font-style: italic;'>Nota: El signo negativo indica que el trabajo es una entrada de energía al sistema (consumo).</p>", unsafe_allow_html=True)
 
@@ -290,34 +254,14 @@ st.markdown("<p style='text-align: center; font-style: italic;'>Nota: El signo n
 with st.expander("Ver desglose de los cálculos", expanded=False):
     st.subheader("Desglose del Cálculo de Potencia")
 
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Tasa de calor disipado (Q̇):</strong><br>
-        {resultados['Q_dot']:.3f} {units['heat_rate']}
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Cambio de entalpía específica (Δh):</strong><br>
-        {resultados['delta_h']:.3f} {units['enthalpy_change']}
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Cambio de energía cinética específica (Δec):</strong><br>
-        {resultados['delta_ec']:.4f} {units['ke_change']}
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown(f"""
-    <div class='resultado-final'>
-        <strong>Potencia de entrada al compresor (Ẇ):</strong><br>
-        {resultados['potencia_w']:.3f} {units['power']}
-    </div>
-
-    """, unsafe_allow_html=True)
+    st.html(tarjetas([
+        ("Tasa de calor disipado (Q̇):", f"{resultados['Q_dot']:.3f} {units['heat_rate']}"),
+        ("Cambio de entalpía específica (Δh):",
+         f"{resultados['delta_h']:.3f} {units['enthalpy_change']}"),
+        ("Cambio de energía cinética específica (Δec):",
+         f"{resultados['delta_ec']:.4f} {units['ke_change']}"),
+        ("Potencia de entrada al compresor (Ẇ):", f"{resultados['potencia_w']:.3f} {units['power']}"),
+    ]))
 
 st.header("Fundamento Teórico")
 with st.expander("Ver Fórmulas Utilizadas", expanded=False):
@@ -1,6 +1,7 @@
 from typing import Dict, Any
 import math
 import streamlit as st
+from styles import inject_theme
 
 # pages/Tobera.py – Dashboard interactivo para análisis de tobera
 # -*- coding: utf-8 -*-
@@ -8,57 +9,7 @@ import streamlit as st
 
 
 # --- Estilos CSS Personalizados ---
-custom_css = """
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-        min-height: 100px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        margin-bottom: 10px;
-    }
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
-
-# --- CONFIGURACIÓN DE LA PÁGINA ---
-try:
-    st.set_page_config(
-        page_title="Análisis de Tobera",
-        page_icon="💨",
-        layout="centered"
-    )
-except st.errors.StreamlitAPIException as e:
-    if "st.set_page_config() can only be called once per app" not in str(e):
-        raise e
+inject_theme(".resultado-final { min-height: 100px; margin-bottom: 10px; }")
 
 # ==============================================================================
 # 1. FUNCIÓN DE CÁLCULO PRINCIPAL
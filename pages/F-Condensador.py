@@ -1,161 +1,303 @@
 
 # -*- coding: utf-8 -*-
+import time
+from collections import deque
+import numpy as np
 import streamlit as st
-from iapws import IAPWS97
-from typing import Dict, Any
+from dataclasses import dataclass, replace
+from functools import wraps
+from typing import NamedTuple, Optional
+from propiedades import saturacion_h, saturacion_valida
+from styles import inject_theme
+
+# --- Teoría (HTML estático con las ecuaciones ya escritas en MathML) ---
+THEORY_CONDENSADOR_HTML = """
+<details class="teoria">
+<summary>📘 Fundamentos Termodinámicos de Compresores (Çengel, 7ª ed.)</summary>
+<p>Los <b>compresores</b> son dispositivos mecánicos que elevan la presión de un gas al reducir su volumen. Son ampliamente utilizados en sistemas de refrigeración, aire acondicionado, turbomáquinas, y plantas industriales.</p>
+<p>A diferencia de las bombas (que trabajan con líquidos), los compresores manipulan <b>gases</b> y generalmente requieren <b>trabajo de entrada</b> para operar, debido a la compresibilidad del fluido.</p>
+<p><b>Principios Clave:</b></p>
+<ul>
+<li><b>Primera Ley para sistemas abiertos:</b> Se analiza aplicando un balance de energía en régimen estacionario.</li>
+<li><b>Trabajo de compresión:</b> El trabajo requerido por unidad de masa está dado por:
+<math display="block"><mi>w</mi><mo>=</mo><msub><mi>h</mi><mn>2</mn></msub><mo>−</mo><msub><mi>h</mi><mn>1</mn></msub></math>
+donde <i>h</i><sub>1</sub> y <i>h</i><sub>2</sub> son las entalpías del gas a la entrada y salida del compresor.</li>
+<li><b>Eficiencia isentrópica:</b> Compara el trabajo real del compresor con el trabajo ideal (reversible y adiabático).</li>
+<li><b>Aumento de temperatura y presión:</b> Durante la compresión, ambos parámetros aumentan, dependiendo del tipo de proceso (isentrópico, politrópico o real).</li>
+</ul>
+<p>📚 <b>Fuente</b>: Çengel, Y. A., &amp; Boles, M. A. (2011). <i>Termodinámica</i> (7ª ed.). McGraw-Hill.</p>
+</details>
+"""
 
 # --- Estilos CSS Personalizados ---
-custom_css = """
-<style>
-    .stApp {
-        background-color: #0e1a40;
-        color: #E0E0E0;
-        font-family: 'Courier New', monospace;
-    }
-    h1, h2, h3 {
-        color: #00BFFF;
-    }
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        background-color: #1B1D2B;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] {
-        background-color: #222f5b;
-        border-radius: 10px;
-    }
-    section[data-testid="stSidebar"] * {
-        color: #c6e2ff !important;
-    }
-    .resultado-final {
-        color: #FFD700;
-        background-color: #2c3e50;
-        border: 1px solid #FFD700;
-        border-radius: 8px;
-        padding: 1rem;
-        text-align: center;
-        font-size: 1.1rem;
-        min-height: 110px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        margin-bottom: 10px;
-    }
+inject_theme("""
+    .resultado-final { min-height: 110px; margin-bottom: 10px; }
     .nota-info {
-        color: #98FB98;
         background-color: rgba(152, 251, 152, 0.1);
         border-left: 5px solid #98FB98;
         padding: 1rem;
         border-radius: 8px;
     }
-</style>
-"""
-st.markdown(custom_css, unsafe_allow_html=True)
-
-# --- CONFIGURACIÓN DE LA PÁGINA ---
-try:
-    st.set_page_config(
-        page_title="Análisis de Condensador",
-        page_icon="💨",
-        layout="centered"
-    )
-except st.errors.StreamlitAPIException as e:
-    if "st.set_page_config() can only be called once per app" not in str(e):
-        raise e
+""")
+
+# --- Propiedades del agua de enfriamiento ---
+CP_AGUA_SI = 4.186  # kJ/kg·°C
+
+# --- Factores de Conversión ---
+KG_MIN_TO_KGS = 1/60
+KGS_TO_LBMS = 2.20462
+KPA_TO_PSI = 0.145038
+C_TO_F_FACTOR = 9/5
+KJ_KG_TO_BTU_LBM = 0.429923
+KW_TO_BTUS = 0.947817
+
+# Factores inversos (Inglés → SI): se multiplica en lugar de dividir
+KPA_TO_MPA = 0.001
+LBM_MIN_TO_KGS = KG_MIN_TO_KGS / KGS_TO_LBMS
+PSI_TO_MPA = KPA_TO_MPA / KPA_TO_PSI
+DEGF_TO_DEGC = 1.0 / C_TO_F_FACTOR
+
+
+
+class Unidades(NamedTuple):
+    """Unidades mostradas en la vista para el sistema seleccionado."""
+    mass_flow_in: str
+    mass_flow: str
+    pressure: str
+    delta_t: str
+    heat_rate: str
+    enthalpy: str
+
+
+class ValoresCondensador(NamedTuple):
+    """
+    Los siete resultados numéricos del condensador y el posible error. En la
+    caché se guardan en SI (kg/s, kW, kJ/kg), sin unidades ni textos, y por eso
+    son comunes a ambos sistemas; `ResultadoCondensador` lleva la misma tupla ya
+    convertida. En la versión por lotes cada valor es un arreglo (uno por punto).
+    """
+    m_dot_agua: float
+    Q_punto: float
+    h_f: float
+    h_g: float
+    h_fg: float
+    h_entrada: float
+    h_salida: float
+    error: Optional[str] = None
+
+    @classmethod
+    def con_error(cls, mensaje: str) -> "ValoresCondensador":
+        nan = float("nan")
+        return cls(nan, nan, nan, nan, nan, nan, nan, mensaje)
+
+
+@dataclass(frozen=True, slots=True)
+class ResultadoCondensador:
+    """
+    Resultado del análisis del condensador en las unidades seleccionadas: los
+    valores convertidos, sus unidades y, en el análisis escalar, el desglose.
+    """
+    valores: ValoresCondensador
+    m_dot_v_kgs: float
+    units: Unidades
+    # Desglose ya formateado: tuplas (subtítulo, líneas); sólo en el análisis escalar
+    reporte: tuple = ()
+
+    @property
+    def error(self) -> Optional[str]:
+        return self.valores.error
+
+
+# Unidades de cada sistema: instancias inmutables creadas una sola vez
+_UNITS_SI = Unidades("kg/min", "kg/s", "kPa", "°C", "kW", "kJ/kg")
+_UNITS_IMP = Unidades("lbm/min", "lbm/s", "psi", "°F", "Btu/s", "Btu/lbm")
+
+# Por sistema de unidades: (factores de entrada → SI para ṁ_v, P, x y ΔT;
+# factores SI → salida para los siete valores de `ValoresCondensador`;
+# unidades mostradas)
+_UNIT_TABLES = {
+    'Sistema Internacional (SI)': (
+        (KG_MIN_TO_KGS, KPA_TO_MPA, 1.0, 1.0),
+        (1.0,) * 7,
+        _UNITS_SI,
+    ),
+    'Sistema Inglés (Imperial)': (
+        (LBM_MIN_TO_KGS, PSI_TO_MPA, 1.0, DEGF_TO_DEGC),
+        (KGS_TO_LBMS, KW_TO_BTUS) + (KJ_KG_TO_BTU_LBM,) * 5,
+        _UNITS_IMP,
+    ),
+}
 
 # ==============================================================================
 # 1. FUNCIÓN DE CÁLCULO PRINCIPAL
 # ==============================================================================
 
 
-@st.cache_data
-def analizar_condensador(
-    m_dot_v_in: float, P_in: float, calidad_in: float, delta_T_in: float,
-    unit_system: str
-) -> Dict[str, Any]:
+def _condensador_si(m_dot_v_kgs, P_MPa, calidad_vapor, delta_T_agua_C) -> ValoresCondensador:
     """
-    Calcula el flujo de enfriamiento en un condensador, manejando unidades SI e Inglesas.
+    Calcula el flujo de enfriamiento en un condensador con entradas en SI (kg/s,
+    MPa, -, °C). Todas las operaciones son de NumPy, así que las entradas pueden
+    ser escalares o arreglos (un resultado por punto de operación).
     """
-    # --- Constantes y Factores de Conversión ---
-    CP_AGUA_SI = 4.186  # kJ/kg·°C
-    KG_MIN_TO_KGS = 1/60
-    KGS_TO_LBMS = 2.20462
-    KPA_TO_PSI = 0.145038
-    C_TO_F_FACTOR = 9/5
-    KJ_KG_TO_BTU_LBM = 0.429923
-    KW_TO_BTUS = 0.947817
-
-    # --- Definición de Unidades y Conversión de Entradas ---
-    units = {}
-    if unit_system == 'Sistema Internacional (SI)':
-        units = {"mass_flow_in": "kg/min", "mass_flow": "kg/s", "pressure": "kPa",
-                 "delta_t": "°C", "heat_rate": "kW", "enthalpy": "kJ/kg"}
-        m_dot_v_kgs = m_dot_v_in * KG_MIN_TO_KGS
-        P_kpa = P_in
-        calidad_vapor = calidad_in
-        delta_T_agua_C = delta_T_in
-    else:  # Sistema Inglés (Imperial)
-        units = {"mass_flow_in": "lbm/min", "mass_flow": "lbm/s", "pressure": "psi",
-                 "delta_t": "°F", "heat_rate": "Btu/s", "enthalpy": "Btu/lbm"}
-        m_dot_v_kgs = (m_dot_v_in / KGS_TO_LBMS) * \
-            KG_MIN_TO_KGS  # lbm/min -> kg/s
-        P_kpa = P_in / KPA_TO_PSI
-        calidad_vapor = calidad_in
-        delta_T_agua_C = delta_T_in / C_TO_F_FACTOR
+    # Validaciones baratas antes de consultar las propiedades
+    if np.any(delta_T_agua_C == 0):
+        return ValoresCondensador.con_error("El incremento de temperatura no puede ser cero.")
+    if not np.all((calidad_vapor >= 0) & (calidad_vapor <= 1)):
+        return ValoresCondensador.con_error("La calidad del vapor debe estar entre 0 y 1.")
+    if not saturacion_valida(P_MPa):
+        return ValoresCondensador.con_error("La presión del vapor está fuera del rango de saturación de IAPWS-IF97.")
 
     try:
-        # --- Cálculos Internos (siempre en SI) ---
-        P_MPa = P_kpa / 1000.0
-        liq_saturado = IAPWS97(P=P_MPa, x=0)
-        vap_saturado = IAPWS97(P=P_MPa, x=1)
+        # Entalpías de saturación (seuif97 con escalares, tabla con arreglos)
+        h_f_kjkg, h_g_kjkg = saturacion_h(P_MPa)
+        # Estados inválidos: código negativo (escalar) o NaN (arreglo)
+        if not np.all(h_g_kjkg > 0):
+            raise ValueError(f"estado fuera de rango (código {h_g_kjkg})")
 
-        h_f_kjkg = liq_saturado.h
-        h_g_kjkg = vap_saturado.h
+        # Balance de energía del vapor (escalares o arreglos)
         h_fg_kjkg = h_g_kjkg - h_f_kjkg
+        x_h_fg_kjkg = calidad_vapor * h_fg_kjkg
 
-        h_entrada_kjkg = h_f_kjkg + calidad_vapor * h_fg_kjkg
+        h_entrada_kjkg = h_f_kjkg + x_h_fg_kjkg
         h_salida_kjkg = h_f_kjkg
 
-        delta_h_v_kjkg = h_entrada_kjkg - h_salida_kjkg
-        Q_punto_kw = m_dot_v_kgs * delta_h_v_kjkg
+        # h_entrada − h_salida = x·h_fg: se usa directamente, sin restar
+        Q_punto_kw = m_dot_v_kgs * x_h_fg_kjkg
 
-        if delta_T_agua_C == 0:
-            return {"error": "El incremento de temperatura no puede ser cero."}
         m_dot_a_kgs = Q_punto_kw / (CP_AGUA_SI * delta_T_agua_C)
 
-        # --- Conversión de Resultados a Unidades Seleccionadas ---
-        if unit_system == 'Sistema Inglés (Imperial)':
-            m_dot_a_final = m_dot_a_kgs * KGS_TO_LBMS
-            Q_punto_final = Q_punto_kw * KW_TO_BTUS
-            h_f_final = h_f_kjkg * KJ_KG_TO_BTU_LBM
-            h_g_final = h_g_kjkg * KJ_KG_TO_BTU_LBM
-            h_fg_final = h_fg_kjkg * KJ_KG_TO_BTU_LBM
-            h_entrada_final = h_entrada_kjkg * KJ_KG_TO_BTU_LBM
-            h_salida_final = h_salida_kjkg * KJ_KG_TO_BTU_LBM
-        else:
-            m_dot_a_final = m_dot_a_kgs
-            Q_punto_final = Q_punto_kw
-            h_f_final = h_f_kjkg
-            h_g_final = h_g_kjkg
-            h_fg_final = h_fg_kjkg
-            h_entrada_final = h_entrada_kjkg
-            h_salida_final = h_salida_kjkg
-
-        return {
-            "m_dot_agua_enfriamiento": m_dot_a_final,
-            "Q_punto": Q_punto_final,
-            "h_f": h_f_final,
-            "h_g": h_g_final,
-            "h_fg": h_fg_final,
-            "h_entrada": h_entrada_final,
-            "h_salida": h_salida_final,
-            "m_dot_v_kgs": m_dot_v_kgs,
-            "units": units,
-            "error": None
-        }
+        return ValoresCondensador(m_dot_a_kgs, Q_punto_kw, h_f_kjkg, h_g_kjkg,
+                              h_fg_kjkg, h_entrada_kjkg, h_salida_kjkg)
     except Exception as e:
-        return {"error": f"Error en cálculo de propiedades: {e}"}
+        return ValoresCondensador.con_error(f"Error en cálculo de propiedades: {e}")
+
+
+@st.cache_data
+def _resultados_si(
+    m_dot_v_kgs: float, P_MPa: float, calidad_vapor: float, delta_T_agua_C: float
+) -> ValoresCondensador:
+    """
+    Resultados en SI de un único punto de operación (valores de la barra
+    lateral). La clave no incluye el sistema de unidades.
+    """
+    return _condensador_si(m_dot_v_kgs, P_MPa, calidad_vapor, delta_T_agua_C)
+
+
+# Claves de st.session_state de las estadísticas (con prefijo de la página) y
+# número máximo de combinaciones de argumentos recordadas por sesión
+_CLAVE_STATS = "condensador_stats_llamadas"
+_CLAVE_VISTAS = "condensador_args_vistos"
+_MAX_ARGS_VISTOS = 256
+
+
+def _contar_llamadas(fn):
+    """
+    Envuelve una función ya cacheada para medir su costo por rerun: cuenta las
+    llamadas con argumentos ya usados en esta sesión ("repetidas") y las nuevas,
+    y acumula el tiempo en st.session_state. No distingue aciertos reales de
+    st.cache_data (la caché es compartida entre sesiones y puede expirar); sólo
+    se recuerdan los últimos `_MAX_ARGS_VISTOS` argumentos. El script se
+    re-ejecuta en cada rerun, así que el estado no puede vivir aquí.
+    """
+    @wraps(fn)
+    def envoltura(*args, **kwargs):
+        stats = st.session_state.setdefault(
+            _CLAVE_STATS, {"repetidas": 0, "nuevas": 0, "t": 0.0})
+        vistas = st.session_state.setdefault(
+            _CLAVE_VISTAS, deque(maxlen=_MAX_ARGS_VISTOS))
+        clave = (args, tuple(sorted(kwargs.items())))
+        if clave in vistas:
+            stats["repetidas"] += 1
+        else:
+            stats["nuevas"] += 1
+            vistas.append(clave)
+        t0 = time.perf_counter()
+        resultado = fn(*args, **kwargs)
+        stats["t"] += time.perf_counter() - t0
+        return resultado
+
+    return envoltura
+
+
+_resultados_si = _contar_llamadas(_resultados_si)
+
+
+@st.cache_data(max_entries=32)
+def _resultados_si_vec(
+    m_dot_v_kgs, P_MPa, calidad_vapor, delta_T_agua_C
+) -> ValoresCondensador:
+    """
+    Resultados en SI de un lote de puntos de operación (arreglos). Las entalpías
+    de saturación se interpolan en la tabla IAPWS-IF97 y el balance de energía se
+    hace elemento a elemento con NumPy.
+    """
+    return _condensador_si(m_dot_v_kgs, P_MPa, calidad_vapor, delta_T_agua_C)
+
+
+def _entradas_a_si(m_dot_v_in, P_in, calidad_in, delta_T_in, unit_system: str) -> tuple:
+    """Convierte las entradas a SI (kg/s, MPa, -, °C) con los factores del sistema."""
+    return tuple(valor * factor for valor, factor in zip(
+        (m_dot_v_in, P_in, calidad_in, delta_T_in), _UNIT_TABLES[unit_system][0]))
+
+
+def _en_unidades(si: ValoresCondensador, m_dot_v_kgs, unit_system: str) -> ResultadoCondensador:
+    """
+    Convierte un resultado cacheado en SI a las unidades seleccionadas y le
+    adjunta sus unidades (constantes del módulo). Con error los valores son NaN
+    y siguen siéndolo tras la conversión.
+    """
+    _, factores_salida, units = _UNIT_TABLES[unit_system]
+    valores = ValoresCondensador(
+        *(valor * factor for valor, factor in zip(si[:-1], factores_salida)),
+        si.error)
+    return ResultadoCondensador(valores, m_dot_v_kgs, units)
+
+
+def analizar_condensador(
+    m_dot_v_in: float, P_in: float, calidad_in: float, delta_T_in: float,
+    unit_system: str
+) -> ResultadoCondensador:
+    """
+    Análisis de un único punto de operación, con sus unidades y el desglose de
+    los cálculos ya formateado.
+    """
+    si = _entradas_a_si(m_dot_v_in, P_in, calidad_in, delta_T_in, unit_system)
+    r = _en_unidades(_resultados_si(*si), si[0], unit_system)
+    if r.error:
+        return r
+    u, v = r.units, r.valores
+    reporte = (
+        ("Datos de Entrada Utilizados", (
+            f"- **Flujo másico de vapor (ṁ_v):** {m_dot_v_in:.1f} {u.mass_flow_in} ({r.m_dot_v_kgs:.3f} kg/s)",
+            f"- **Presión del vapor (P):** {P_in:.2f} {u.pressure}",
+            f"- **Calidad del vapor (x):** {calidad_in:.2f}",
+            f"- **Incremento de temp. del agua (ΔT):** {delta_T_in:.1f} {u.delta_t}",
+        )),
+        (f"Propiedades del Vapor (a {P_in:.2f} {u.pressure})", (
+            f"- **Entalpía del líquido saturado ($h_f$):** {v.h_f:.2f} {u.enthalpy}",
+            f"- **Entalpía del vapor saturado ($h_g$):** {v.h_g:.2f} {u.enthalpy}",
+            f"- **Entalpía de vaporización ($h_{{fg}}$):** {v.h_fg:.2f} {u.enthalpy}",
+        )),
+        ("Balance de Energía para el Vapor", (
+            f"- **Entalpía de entrada ($h_{{entrada}}$):** {v.h_entrada:.2f} {u.enthalpy}",
+            f"- **Entalpía de salida ($h_{{salida}}$):** {v.h_salida:.2f} {u.enthalpy}",
+            f"**- Tasa de calor liberado por el vapor ($\\dot{{Q}}$):** {v.Q_punto:.2f} {u.heat_rate}",
+        )),
+    )
+    return replace(r, reporte=reporte)
+
+
+def analizar_condensador_vec(
+    m_dot_v_in, P_in, calidad_in, delta_T_in, unit_system: str
+) -> ResultadoCondensador:
+    """
+    Análisis de un lote de puntos de operación: cualquier entrada puede ser una
+    lista o arreglo.
+    """
+    si = _entradas_a_si(*(np.asarray(e, dtype=np.float64)
+                          for e in (m_dot_v_in, P_in, calidad_in, delta_T_in)),
+                        unit_system)
+    return _en_unidades(_resultados_si_vec(*si), si[0], unit_system)
 
 
 # ==============================================================================
@@ -176,24 +318,10 @@ Podrás observar cómo cambian variables clave como **presión**, **temperatura*
 st.write("---")
 
 
-with st.expander("📘 Fundamentos Termodinámicos de Compresores (Çengel, 7ª ed.)"):
-    st.markdown(r"""
-        Los **compresores** son dispositivos mecánicos que elevan la presión de un gas al reducir su volumen. Son ampliamente utilizados en sistemas de refrigeración, aire acondicionado, turbomáquinas, y plantas industriales.
-
-        A diferencia de las bombas (que trabajan con líquidos), los compresores manipulan **gases** y generalmente requieren **trabajo de entrada** para operar, debido a la compresibilidad del fluido.
-
-        **Principios Clave:**
-        - **Primera Ley para sistemas abiertos:** Se analiza aplicando un balance de energía en régimen estacionario.
-        - **Trabajo de compresión:** El trabajo requerido por unidad de masa está dado por:
-          $$
-          w = h_2 - h_1
-          $$
-          donde \( h_1 \) y \( h_2 \) son las entalpías del gas a la entrada y salida del compresor.
-        - **Eficiencia isentrópica:** Compara el trabajo real del compresor con el trabajo ideal (reversible y adiabático).
-        - **Aumento de temperatura y presión:** Durante la compresión, ambos parámetros aumentan, dependiendo del tipo de proceso (isentrópico, politrópico o real).
-
-        📚 **Fuente**: Çengel, Y. A., & Boles, M. A. (2011). *Termodinámica* (7ª ed.). McGraw-Hill.
-    """)
+# =========================
+# 📘 Teoría
+# =========================
+st.html(THEORY_CONDENSADOR_HTML)
 
 col1, col2 = st.columns(2)
 with col1:
@@ -236,63 +364,106 @@ st.sidebar.header("Parámetros de Entrada")
 unit_system = st.sidebar.radio("Seleccione el Sistema de Unidades",
                                ('Sistema Internacional (SI)', 'Sistema Inglés (Imperial)'))
 
-if unit_system == 'Sistema Internacional (SI)':
-    m_dot_v = st.sidebar.slider(
-        "Flujo másico de vapor [kg/min]", 1.0, 1000.0, 420.0, 1.0)
-    P = st.sidebar.slider("Presión del vapor [kPa]", 5.0, 600.0, 30.0, 0.5)
-    calidad = st.sidebar.slider("Calidad del vapor (x)", 0.0, 1.0, 0.90, 0.01)
-    delta_T = st.sidebar.slider(
-        "Incremento de temp. del agua [°C]", 1.0, 30.0, 10.0, 0.5)
-else:  # Sistema Inglés
-    m_dot_v = st.sidebar.slider(
-        "Flujo másico de vapor [lbm/min]", 2.0, 2200.0, 926.0, 10.0)
-    P = st.sidebar.slider("Presión del vapor [psi]", 0.7, 30.0, 4.35, 0.05)
-    calidad = st.sidebar.slider("Calidad del vapor (x)", 0.0, 1.0, 0.90, 0.01)
-    delta_T = st.sidebar.slider(
-        "Incremento de temp. del agua [°F]", 2.0, 55.0, 18.0, 1.0)
+# Los deslizadores van dentro de un formulario: arrastrarlos no provoca una
+# nueva ejecución; el cálculo se hace una vez por cada "Calcular".
+with st.sidebar.form("cond"):
+    if unit_system == 'Sistema Internacional (SI)':
+        m_dot_v = st.slider(
+            "Flujo másico de vapor [kg/min]", 1.0, 1000.0, 420.0, 1.0)
+        P = st.slider("Presión del vapor [kPa]", 5.0, 600.0, 30.0, 0.5)
+        calidad = st.slider("Calidad del vapor (x)", 0.0, 1.0, 0.90, 0.01)
+        delta_T = st.slider(
+            "Incremento de temp. del agua [°C]", 1.0, 30.0, 10.0, 0.5)
+    else:  # Sistema Inglés
+        m_dot_v = st.slider(
+            "Flujo másico de vapor [lbm/min]", 2.0, 2200.0, 926.0, 10.0)
+        P = st.slider("Presión del vapor [psi]", 0.7, 30.0, 4.35, 0.05)
+        calidad = st.slider("Calidad del vapor (x)", 0.0, 1.0, 0.90, 0.01)
+        delta_T = st.slider(
+            "Incremento de temp. del agua [°F]", 2.0, 55.0, 18.0, 1.0)
+    submitted = st.form_submit_button("Calcular")
+
+# --- Barrido de un parámetro (evaluado en un solo lote) ---
+RANGOS_BARRIDO = {
+    'Sistema Internacional (SI)': {
+        "Flujo másico de vapor [kg/min]": (0, 1.0, 1000.0),
+        "Presión del vapor [kPa]": (1, 5.0, 600.0),
+        "Calidad del vapor (x)": (2, 0.0, 1.0),
+        "Incremento de temp. del agua [°C]": (3, 1.0, 30.0),
+    },
+    'Sistema Inglés (Imperial)': {
+        "Flujo másico de vapor [lbm/min]": (0, 2.0, 2200.0),
+        "Presión del vapor [psi]": (1, 0.7, 30.0),
+        "Calidad del vapor (x)": (2, 0.0, 1.0),
+        "Incremento de temp. del agua [°F]": (3, 2.0, 55.0),
+    },
+}
+N_PUNTOS_BARRIDO = 60
+
+st.sidebar.subheader("Barrer Parámetro")
+parametro_barrido = st.sidebar.selectbox(
+    "Parámetro a barrer", ["Ninguno"] + list(RANGOS_BARRIDO[unit_system]))
 
 # --- Ejecución y Presentación de Resultados ---
-resultados = analizar_condensador(m_dot_v, P, calidad, delta_T, unit_system)
+# Claves de st.session_state de los últimos resultados (con prefijo de la página)
+_CLAVE_RESULTADOS = "condensador_resultados"
+_CLAVE_UNIDADES = "condensador_unit_system"
+
+# Se recalcula al enviar el formulario, en la primera ejecución o al cambiar de
+# sistema de unidades (los resultados guardados estarían en otras unidades).
+if (submitted or _CLAVE_RESULTADOS not in st.session_state
+        or st.session_state.get(_CLAVE_UNIDADES) != unit_system):
+    st.session_state[_CLAVE_RESULTADOS] = analizar_condensador(
+        m_dot_v, P, calidad, delta_T, unit_system)
+    st.session_state[_CLAVE_UNIDADES] = unit_system
+resultados = st.session_state[_CLAVE_RESULTADOS]
+
+if st.sidebar.checkbox("Mostrar estadísticas de cálculo"):
+    stats = st.session_state.get(
+        _CLAVE_STATS, {"repetidas": 0, "nuevas": 0, "t": 0.0})
+    st.sidebar.caption(
+        f"Entradas repetidas en la sesión: {stats['repetidas']} · "
+        f"Nuevas: {stats['nuevas']} · "
+        f"Tiempo acumulado: {stats['t'] * 1000:.1f} ms")
 
 st.header("📊 Resultados del Análisis")
 
-if resultados.get("error"):
-    st.error(f"**Error en el cálculo:** {resultados['error']}")
+if resultados.error:
+    st.error(f"**Error en el cálculo:** {resultados.error}")
 else:
-    units = resultados['units']
-    st.markdown(f"""
+    units = resultados.units
+    st.html(f"""
     <div class='resultado-final' style='background-color: #004d40; border-color: #00BFFF;'>
         <strong style='color: #E0E0E0;'>Flujo de Agua de Enfriamiento Requerido (ṁ_agua):</strong>
         <span style='font-size: 1.5rem; color: #FFFFFF; margin-top: 10px;'>
-            {resultados['m_dot_agua_enfriamiento']:.2f} {units['mass_flow']}
+            {resultados.valores.m_dot_agua:.2f} {units.mass_flow}
         </span>
     </div>
-    """, unsafe_allow_html=True)
+    """)
 
     with st.expander("Ver desglose de los cálculos"):
-        st.subheader("Datos de Entrada Utilizados")
-        st.write(
-            f"- **Flujo másico de vapor (ṁ_v):** {m_dot_v:.1f} {units['mass_flow_in']} ({resultados['m_dot_v_kgs']:.3f} kg/s)")
-        st.write(f"- **Presión del vapor (P):** {P:.2f} {units['pressure']}")
-        st.write(f"- **Calidad del vapor (x):** {calidad:.2f}")
-        st.write(
-            f"- **Incremento de temp. del agua (ΔT):** {delta_T:.1f} {units['delta_t']}")
-
-        st.subheader(f"Propiedades del Vapor (a {P:.2f} {units['pressure']})")
-        st.write(
-            f"- **Entalpía del líquido saturado ($h_f$):** {resultados['h_f']:.2f} {units['enthalpy']}")
-        st.write(
-            f"- **Entalpía del vapor saturado ($h_g$):** {resultados['h_g']:.2f} {units['enthalpy']}")
-        st.write(
-            f"- **Entalpía de vaporización ($h_{{fg}}$):** {resultados['h_fg']:.2f} {units['enthalpy']}")
-
-        st.subheader("Balance de Energía para el Vapor")
-        st.write(
-            f"- **Entalpía de entrada ($h_{{entrada}}$):** {resultados['h_entrada']:.2f} {units['enthalpy']}")
-        st.write(
-            f"- **Entalpía de salida ($h_{{salida}}$):** {resultados['h_salida']:.2f} {units['enthalpy']}")
-        st.write(
-            f"**- Tasa de calor liberado por el vapor ($\\dot{{Q}}$):** {resultados['Q_punto']:.2f} {units['heat_rate']}")
+        for subtitulo, lineas in resultados.reporte:
+            st.subheader(subtitulo)
+            for linea in lineas:
+                st.write(linea)
+
+    if parametro_barrido != "Ninguno":
+        # Se evalúan todos los puntos del barrido en un solo lote
+        indice, minimo, maximo = RANGOS_BARRIDO[unit_system][parametro_barrido]
+        entradas = [m_dot_v, P, calidad, delta_T]
+        valores = np.linspace(minimo, maximo, N_PUNTOS_BARRIDO)
+        entradas[indice] = valores
+        barrido = analizar_condensador_vec(*entradas, unit_system)
+
+        st.divider()
+        st.subheader(f"📈 Agua de enfriamiento vs. {parametro_barrido}")
+        if barrido.error:
+            st.warning(f"No se pudo calcular el barrido: {barrido.error}")
+        else:
+            st.line_chart({
+                parametro_barrido: valores,
+                "ṁ_agua": barrido.valores.m_dot_agua,
+            }, x=parametro_barrido, y_label=f"ṁ_agua [{units.mass_flow}]")
 
 st.markdown("---")
 st.markdown("""
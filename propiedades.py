@@ -0,0 +1,214 @@
+# propiedades.py
+# -*- coding: utf-8 -*-
+"""
+Propiedades del agua (IAPWS-IF97) tabuladas para barridos de parámetros.
+
+Para un solo estado (un valor de cada deslizador) `seuif97` ya es la opción más
+rápida y exacta. Cuando se evalúan muchos estados a la vez (arreglos de NumPy),
+las funciones de este módulo interpolan sobre tablas precalculadas una sola vez
+por proceso, y recurren al cálculo exacto sólo en las celdas que cruzan la línea
+de saturación o están cerca del punto crítico.
+"""
+
+import math
+from types import MappingProxyType
+
+import numpy as np
+import seuif97
+import streamlit as st
+
+# Identificadores de propiedad de seuif97
+OT = 1  # Temperatura [°C]
+OV = 3  # Volumen específico [m³/kg]
+OH = 4  # Entalpía [kJ/kg]
+
+# --- Límites de validez de IAPWS-IF97 ---
+P_TRIPLE_MPA = 0.000611657
+P_CRITICA_MPA = 22.064
+T_MIN_IF97_C, T_MAX_IF97_C = 0.0, 2000.0
+T_REGION5_C = 800.0  # Por encima de esta temperatura la presión máxima es 50 MPa
+
+# --- Dominio de las tablas ---
+# Zona cercana al punto crítico donde la interpolación pierde precisión
+ZONA_CRITICA_P_MPA = (15.0, 30.0)
+ZONA_CRITICA_T_C = (330.0, 450.0)
+# La tabla de saturación cubre el mismo rango que acepta `saturacion_valida`
+P_SAT_MIN_MPA, P_SAT_MAX_MPA, N_SAT = P_TRIPLE_MPA, P_CRITICA_MPA, 2048
+P_MIN_MPA, P_MAX_MPA, N_P = 0.01, 25.0, 512
+T_MIN_C, T_MAX_C, N_T = 10.0, 1300.0, 512
+
+
+def _todos(condicion) -> bool:
+    return condicion if isinstance(condicion, bool) else bool(np.all(condicion))
+
+
+def saturacion_valida(P_MPa) -> bool:
+    """
+    Comprueba, sin llamar a la librería, que la presión [MPa] (escalar o arreglo)
+    esté sobre la línea de saturación de IAPWS-IF97 (punto triple a punto crítico).
+    """
+    return _todos((P_MPa >= P_TRIPLE_MPA) & (P_MPa <= P_CRITICA_MPA))
+
+
+def pt_valido(P_MPa, T_C) -> bool:
+    """
+    Comprueba, sin llamar a la librería, que (P [MPa], T [°C]) (escalares o
+    arreglos) esté dentro del dominio de IAPWS-IF97.
+    """
+    return _todos((P_MPa > 0) & (T_C >= T_MIN_IF97_C) & (T_C <= T_MAX_IF97_C)
+                  & (P_MPa <= 100.0) & ((T_C <= T_REGION5_C) | (P_MPa <= 50.0)))
+
+
+@st.cache_resource
+def tablas_if97() -> MappingProxyType:
+    """
+    Construye las tablas de propiedades: líneas de líquido y vapor saturados en
+    función de ln(P) y la malla (ln(P), T) con ln(v) y h. Se guardan como arreglos de
+    NumPy de sólo lectura compartidos por todas las sesiones.
+    """
+    lnP_sat = np.linspace(math.log(P_SAT_MIN_MPA), math.log(P_SAT_MAX_MPA), N_SAT)
+    P_sat = np.exp(lnP_sat)
+    T_sat = np.array([seuif97.px(p, 0.0, OT) for p in P_sat])
+    v_f = np.array([seuif97.px(p, 0.0, OV) for p in P_sat])
+    h_f = np.array([seuif97.px(p, 0.0, OH) for p in P_sat])
+    v_g = np.array([seuif97.px(p, 1.0, OV) for p in P_sat])
+    h_g = np.array([seuif97.px(p, 1.0, OH) for p in P_sat])
+
+    lnP = np.linspace(math.log(P_MIN_MPA), math.log(P_MAX_MPA), N_P)
+    P = np.exp(lnP)
+    T = np.linspace(T_MIN_C, T_MAX_C, N_T)
+    ln_v = np.array([[math.log(seuif97.pt(p, t, OV)) for t in T] for p in P])
+    h = np.array([[seuif97.pt(p, t, OH) for t in T] for p in P])
+
+    # Fase de cada nodo (líquido comprimido o no) para detectar las celdas que
+    # cruzan la línea de saturación, donde v y h son discontinuos.
+    T_sat_nodos = np.interp(lnP, lnP_sat, T_sat, right=np.inf)
+    liquido = T[np.newaxis, :] < T_sat_nodos[:, np.newaxis]
+
+    tablas = {
+        "lnP_sat": lnP_sat, "T_sat": T_sat, "v_f": v_f, "h_f": h_f,
+        "v_g": v_g, "h_g": h_g,
+        "lnP": lnP, "T": T, "ln_v": ln_v, "h": h, "liquido": liquido,
+    }
+    # La misma instancia se comparte entre sesiones: nada debe poder modificarla
+    for arr in tablas.values():
+        arr.setflags(write=False)
+    return MappingProxyType(tablas)
+
+
+# Columnas de la tabla de saturación: (calidad, propiedad de seuif97)
+_COLUMNAS_SAT = {"v_f": (0.0, OV), "h_f": (0.0, OH), "v_g": (1.0, OV), "h_g": (1.0, OH)}
+
+
+def _lineas_saturacion(P_MPa, *columnas) -> list:
+    """
+    Interpola en ln(P) las columnas pedidas de la tabla de saturación (NaN fuera
+    del dominio). Por encima de la zona crítica las líneas se curvan demasiado
+    para interpolar, así que esos puntos se calculan con seuif97.
+    """
+    t = tablas_if97()
+    P_MPa = np.atleast_1d(np.asarray(P_MPa, dtype=float))
+    lnP = np.log(P_MPa)
+    valores = [np.interp(lnP, t["lnP_sat"], t[c], left=np.nan, right=np.nan)
+               for c in columnas]
+    exacto = (P_MPa >= ZONA_CRITICA_P_MPA[0]) & (P_MPa <= P_CRITICA_MPA)
+    for k in zip(*np.nonzero(exacto)):
+        for arr, c in zip(valores, columnas):
+            x, propiedad = _COLUMNAS_SAT[c]
+            arr[k] = seuif97.px(P_MPa[k], x, propiedad)
+    return valores
+
+
+def liquido_saturado_vh(P_MPa: float) -> tuple:
+    """
+    Volumen específico [m³/kg] y entalpía [kJ/kg] del líquido saturado (x=0) a
+    la presión P [MPa], consultando seuif97 directamente (negativo si el estado
+    es inválido).
+    """
+    return seuif97.px(P_MPa, 0.0, OV), seuif97.px(P_MPa, 0.0, OH)
+
+
+def saturacion_h(P_MPa):
+    """
+    Entalpías [kJ/kg] del líquido (h_f) y del vapor (h_g) saturados para una
+    presión o un arreglo de presiones [MPa]. Con escalares consulta seuif97
+    directamente (negativo si el estado es inválido); con arreglos
+    interpola en ln(P) sobre la tabla de saturación (NaN fuera del dominio) y
+    calcula exactamente los puntos cercanos al punto crítico.
+    """
+    if np.ndim(P_MPa) == 0:
+        return seuif97.px(P_MPa, 0.0, OH), seuif97.px(P_MPa, 1.0, OH)
+    h_f, h_g = _lineas_saturacion(P_MPa, "h_f", "h_g")
+    return h_f, h_g
+
+
+def vh_px(P_MPa, x):
+    """
+    Volumen específico [m³/kg] y entalpía [kJ/kg] de la mezcla saturada con
+    calidad x para una presión o un arreglo de presiones [MPa]. Con escalares
+    consulta seuif97 directamente (negativo si el estado es inválido); con
+    arreglos interpola las líneas de saturación y mezcla linealmente en x.
+    """
+    if np.ndim(P_MPa) == 0 and np.ndim(x) == 0:
+        return seuif97.px(P_MPa, x, OV), seuif97.px(P_MPa, x, OH)
+    x = np.asarray(x, dtype=float)
+    v_f, v_g, h_f, h_g = _lineas_saturacion(P_MPa, "v_f", "v_g", "h_f", "h_g")
+    fuera = (x < 0) | (x > 1)
+    v = np.where(fuera, np.nan, v_f + x * (v_g - v_f))
+    h = np.where(fuera, np.nan, h_f + x * (h_g - h_f))
+    return v, h
+
+
+def vh_pt(P_MPa, T_C):
+    """
+    Volumen específico [m³/kg] y entalpía [kJ/kg] para arreglos de presión
+    [MPa] y temperatura [°C] (región monofásica). Con escalares consulta
+    seuif97 directamente (negativo si el estado es inválido); con arreglos
+    interpola en la tabla (NaN fuera del dominio).
+    """
+    if np.ndim(P_MPa) == 0 and np.ndim(T_C) == 0:
+        return seuif97.pt(P_MPa, T_C, OV), seuif97.pt(P_MPa, T_C, OH)
+    t = tablas_if97()
+    P_MPa, T_C = np.broadcast_arrays(
+        np.asarray(P_MPa, dtype=float), np.asarray(T_C, dtype=float))
+    lnP = np.log(P_MPa)
+
+    # Posición fraccional dentro de la malla
+    fi = (lnP - t["lnP"][0]) / (t["lnP"][1] - t["lnP"][0])
+    fj = (T_C - t["T"][0]) / (t["T"][1] - t["T"][0])
+    fuera = (fi < 0) | (fi > N_P - 1) | (fj < 0) | (fj > N_T - 1)
+    i = np.clip(fi.astype(int), 0, N_P - 2)
+    j = np.clip(fj.astype(int), 0, N_T - 2)
+    di = np.clip(fi - i, 0.0, 1.0)
+    dj = np.clip(fj - j, 0.0, 1.0)
+
+    def bilineal(z):
+        return ((1 - di) * (1 - dj) * z[i, j] + di * (1 - dj) * z[i + 1, j]
+                + (1 - di) * dj * z[i, j + 1] + di * dj * z[i + 1, j + 1])
+
+    v = np.exp(bilineal(t["ln_v"]))
+    h = bilineal(t["h"])
+
+    # Celdas con nodos de distinta fase o cercanas al punto crítico:
+    # cálculo exacto punto a punto
+    liq = t["liquido"]
+    mixta = ((liq[i, j] != liq[i + 1, j]) | (liq[i, j] != liq[i, j + 1])
+             | (liq[i, j] != liq[i + 1, j + 1]))
+    critica = ((P_MPa >= ZONA_CRITICA_P_MPA[0]) & (P_MPa <= ZONA_CRITICA_P_MPA[1])
+               & (T_C >= ZONA_CRITICA_T_C[0]) & (T_C <= ZONA_CRITICA_T_C[1]))
+    exacto = ~fuera & (mixta | critica)
+    for k in zip(*np.nonzero(exacto)):
+        v[k] = seuif97.pt(P_MPa[k], T_C[k], OV)
+        h[k] = seuif97.pt(P_MPa[k], T_C[k], OH)
+
+    v[fuera] = np.nan
+    h[fuera] = np.nan
+    return v, h
+
+
+def v_pt(P_MPa: float, T_C: float) -> float:
+    """
+    Sólo el volumen específico [m³/kg] en (P [MPa], T [°C]); evita calcular la
+    entalpía cuando no se necesita (negativo si el estado es inválido).
+    """
+    return seuif97.pt(P_MPa, T_C, OV)
@@ -0,0 +1,23 @@
+# recursos.py
+# -*- coding: utf-8 -*-
+"""Recursos remotos (imágenes del repositorio) compartidos por las páginas."""
+
+import requests
+import streamlit as st
+
+
+@st.cache_resource(ttl="24h", show_spinner=False)
+def cargar_imagen(url: str):
+    """
+    Devuelve los bytes de la imagen, descargados una sola vez por proceso y
+    compartidos (sin copiarlos) entre todas las sesiones.
+    Si la descarga falla se devuelve la URL para que st.image la enlace
+    directamente, como antes; el resultado también queda en caché para no
+    repetir el intento (y su espera) en cada rerun.
+    """
+    try:
+        respuesta = requests.get(url, timeout=5)
+        respuesta.raise_for_status()
+        return respuesta.content
+    except requests.RequestException:
+        return url
@@ -0,0 +1,105 @@
+# styles.py
+# -*- coding: utf-8 -*-
+"""Estilos CSS compartidos por la página de inicio y todos los simuladores."""
+
+import streamlit as st
+
+# --- Estilos CSS Personalizados ---
+THEME_CSS = """
+<style>
+    .stApp {
+        background-color: #0e1a40;
+        color: #E0E0E0;
+        font-family: 'Courier New', monospace;
+    }
+    h1, h2, h3 {
+        color: #00BFFF;
+    }
+    .main .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+        background-color: #1B1D2B;
+        border-radius: 10px;
+    }
+    section[data-testid="stSidebar"] {
+        background-color: #222f5b;
+        border-radius: 10px;
+    }
+    section[data-testid="stSidebar"] * {
+        color: #c6e2ff !important;
+    }
+    .resultado-final {
+        color: #FFD700;
+        background-color: #2c3e50;
+        border: 1px solid #FFD700;
+        border-radius: 8px;
+        padding: 1rem;
+        text-align: center;
+        font-size: 1.1rem;
+        display: flex;
+        flex-direction: column;
+        justify-content: center;
+    }
+    .fila-resultados {
+        display: flex;
+        gap: 1rem;
+    }
+    .fila-resultados .resultado-final {
+        flex: 1;
+    }
+    .nota-info {
+        color: #98FB98;
+    }
+    details.teoria {
+        border: 1px solid rgba(198, 226, 255, 0.3);
+        border-radius: 8px;
+        padding: 0.5rem 1rem;
+        margin-bottom: 1rem;
+    }
+    details.teoria summary {
+        cursor: pointer;
+    }
+    details.teoria math[display="block"] {
+        margin: 1rem 0;
+        font-size: 1.2rem;
+    }
+</style>
+"""
+
+
+@st.cache_resource
+def _theme_css(extra_css: str = "") -> str:
+    """
+    Construye (una sola vez por proceso) el bloque CSS de cada página. Se usa
+    st.cache_resource porque la cadena es inmutable: cada acierto devuelve el
+    mismo objeto sin copiarlo.
+    """
+    if extra_css:
+        return THEME_CSS + f"<style>{extra_css}</style>"
+    return THEME_CSS
+
+
+def inject_theme(extra_css: str = "") -> None:
+    """
+    Inyecta el tema común de la aplicación. `extra_css` permite a cada página
+    ajustar reglas propias (p. ej. la altura de las tarjetas de resultados).
+    """
+    st.html(_theme_css(extra_css))
+
+
+def tarjetas(pares) -> str:
+    """
+    Construye tarjetas `.resultado-final` (una debajo de otra) a partir de pares
+    (título, valor), para emitirlas con una sola llamada a `st.html`.
+    """
+    return "".join(
+        f"<div class='resultado-final'><strong>{titulo}</strong><br>{valor}</div>"
+        for titulo, valor in pares
+    )
+
+
+def fila_de_tarjetas(pares) -> str:
+    """
+    Igual que `tarjetas`, pero dispuestas en una fila.
+    """
+    return f"<div class='fila-resultados'>{tarjetas(pares)}</div>"